@@ -35,6 +35,21 @@ class BreedPreset:
         self.custom_probabilities = custom_probabilities or {}
         self.base_color_weights = base_color_weights or {}
 
+    @property
+    def random_kwargs(self) -> Dict[str, Optional[object]]:
+        """
+        Keyword arguments for Horse.random() / Horse.random_batch().
+
+        Empty settings are passed as None so generation skips them.
+
+        Example:
+            horse = Horse.random(**preset.random_kwargs)
+        """
+        return {
+            'excluded_genes': self.excluded_genes or None,
+            'custom_probabilities': self.custom_probabilities or None,
+        }
+
 
 # ============================================================================
 # REALISTIC BREED PRESETS
@@ -16,12 +16,14 @@ Example usage:
         print(f"{phenotype}: {probability:.1%}")
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from collections import defaultdict
 from genetics.horse import Horse
 from genetics.gene_registry import get_default_registry
 from genetics.gene_interaction import PhenotypeCalculator
 import itertools
+import operator
+from functools import reduce
 
 
 def calculate_gene_probabilities(
@@ -73,65 +75,72 @@ def calculate_gene_probabilities(
     return probabilities
 
 
-def calculate_all_genotype_combinations(
+# Number of offspring genotypes phenotyped per batch in the exact calculation
+_PHENOTYPE_CHUNK_SIZE = 4096
+
+
+def iter_genotype_combinations(
     parent1_genotype: Dict[str, Tuple[str, str]],
     parent2_genotype: Dict[str, Tuple[str, str]],
     registry=None
-) -> List[Tuple[Dict[str, Tuple[str, str]], float]]:
+) -> Iterator[Tuple[Dict[str, Tuple[str, str]], float]]:
     """
-    Calculate all possible offspring genotypes with their probabilities.
+    Lazily yield all possible offspring genotypes with their probabilities.
 
-    This can generate many combinations (up to 4^9 = 262,144 for 9 genes),
-    so we use a smart approach to combine probabilities.
+    Same results as calculate_all_genotype_combinations(), without holding
+    the whole cartesian product in memory.
 
     Args:
         parent1_genotype: Parent 1 complete genotype
         parent2_genotype: Parent 2 complete genotype
         registry: GeneRegistry instance
 
-    Returns:
-        List of (genotype, probability) tuples
+    Yields:
+        (genotype, probability) tuples
     """
     if registry is None:
         registry = get_default_registry()
 
-    # Calculate probabilities for each gene independently
-    gene_probabilities = {}
-
-    for gene_name in registry.get_all_gene_names():
-        p1_alleles = parent1_genotype[gene_name]
-        p2_alleles = parent2_genotype[gene_name]
-
-        gene_def = registry.get_gene(gene_name)
-        gene_probs = calculate_gene_probabilities(p1_alleles, p2_alleles, gene_def)
-        gene_probabilities[gene_name] = gene_probs
-
-    # Generate all combinations using itertools.product
-    # This creates a cartesian product of all gene possibilities
     gene_names = registry.get_all_gene_names()
 
-    # Create list of (gene_name, [(genotype, probability), ...]) for each gene
+    # Calculate probabilities for each gene independently. The genotypes are
+    # already dominance-sorted by calculate_gene_probabilities, so the product
+    # loop below doesn't need to look up genes or sort alleles again.
     gene_options = [
-        [(gene_name, genotype, prob) for genotype, prob in gene_probabilities[gene_name].items()]
+        list(calculate_gene_probabilities(
+            parent1_genotype[gene_name],
+            parent2_genotype[gene_name],
+            registry.get_gene(gene_name)
+        ).items())
         for gene_name in gene_names
     ]
 
-    # Generate all combinations
-    all_combinations = []
-
+    # Generate all combinations (cartesian product of all gene possibilities)
     for combination in itertools.product(*gene_options):
-        # Build genotype from this combination
-        genotype = {}
-        total_probability = 1.0
+        genotypes, probabilities = zip(*combination)
+        yield dict(zip(gene_names, genotypes)), reduce(operator.mul, probabilities, 1.0)
+
+
+def calculate_all_genotype_combinations(
+    parent1_genotype: Dict[str, Tuple[str, str]],
+    parent2_genotype: Dict[str, Tuple[str, str]],
+    registry=None
+) -> List[Tuple[Dict[str, Tuple[str, str]], float]]:
+    """
+    Calculate all possible offspring genotypes with their probabilities.
 
-        for gene_name, alleles, prob in combination:
-            gene_def = registry.get_gene(gene_name)
-            genotype[gene_name] = gene_def.sort_alleles(list(alleles))
-            total_probability *= prob
+    This can generate many combinations (up to 4^9 = 262,144 for 9 genes),
+    so we use a smart approach to combine probabilities.
 
-        all_combinations.append((genotype, total_probability))
+    Args:
+        parent1_genotype: Parent 1 complete genotype
+        parent2_genotype: Parent 2 complete genotype
+        registry: GeneRegistry instance
 
-    return all_combinations
+    Returns:
+        List of (genotype, probability) tuples
+    """
+    return list(iter_genotype_combinations(parent1_genotype, parent2_genotype, registry))
 
 
 def calculate_offspring_probabilities(
@@ -183,16 +192,21 @@ def calculate_offspring_probabilities(
             phenotype = calculator.determine_phenotype(offspring_genotype)
             phenotype_probabilities[phenotype] += 1.0 / sample_size
     else:
-        # Exact calculation: enumerate all possibilities
-        all_combinations = calculate_all_genotype_combinations(
+        # Exact calculation: enumerate all possibilities, phenotyping them in
+        # fixed-size chunks so memory stays bounded for large products
+        combinations = iter_genotype_combinations(
             parent1_genotype,
             parent2_genotype,
             registry
         )
 
-        for genotype, probability in all_combinations:
-            phenotype = calculator.determine_phenotype(genotype)
-            phenotype_probabilities[phenotype] += probability
+        while True:
+            chunk = list(itertools.islice(combinations, _PHENOTYPE_CHUNK_SIZE))
+            if not chunk:
+                break
+            phenotypes = calculator.determine_phenotypes([genotype for genotype, _ in chunk])
+            for phenotype, (_, probability) in zip(phenotypes, chunk):
+                phenotype_probabilities[phenotype] += probability
 
     # Sort by probability (highest first)
     sorted_probabilities = dict(
@@ -206,6 +220,52 @@ def calculate_offspring_probabilities(
     return sorted_probabilities
 
 
+def calculate_offspring_probabilities_batch(
+    pairs: Iterable[Tuple[str, str]],
+    registry=None,
+    calculator=None
+) -> Dict[Tuple[str, str], Dict[str, float]]:
+    """
+    Calculate exact offspring probabilities for many parent pairs.
+
+    Shares one registry and calculator across all pairs and computes each
+    distinct pair only once. Inheritance is symmetric, so (a, b) and (b, a)
+    also share a single calculation; each key still gets its own dict.
+
+    Args:
+        pairs: Iterable of (parent1, parent2) genotype string pairs
+        registry: Optional GeneRegistry instance
+        calculator: Optional PhenotypeCalculator instance
+
+    Returns:
+        dict: {(parent1, parent2): {phenotype: probability}} for every input pair
+
+    Example:
+        >>> results = calculate_offspring_probabilities_batch(
+        ...     [(mare, stallion) for stallion in stallions]
+        ... )  # doctest: +SKIP
+    """
+    if registry is None:
+        registry = get_default_registry()
+    if calculator is None:
+        calculator = PhenotypeCalculator(registry)
+
+    results = {}
+    for parent1, parent2 in pairs:
+        if (parent1, parent2) in results:
+            continue
+        mirrored = results.get((parent2, parent1))
+        if mirrored is None:
+            results[(parent1, parent2)] = calculate_offspring_probabilities(
+                parent1, parent2, registry=registry, calculator=calculator
+            )
+        else:
+            # Copy so callers can edit one orientation without changing the other
+            results[(parent1, parent2)] = dict(mirrored)
+
+    return results
+
+
 def format_probability_report(
     probabilities: Dict[str, float],
     min_probability: float = 0.001
@@ -241,7 +301,7 @@ def format_probability_report(
         return '\n'.join(lines)
 
     # Find longest phenotype name for alignment
-    max_name_length = max(len(name) for name in filtered.keys())
+    max_name_length = max(len(name) for name in filtered)
 
     for phenotype, probability in filtered.items():
         # Calculate bar length (max 40 characters)
@@ -301,7 +361,7 @@ def get_guaranteed_traits(
 
         # If only one unique allele exists, offspring is guaranteed homozygous
         if len(possible_alleles) == 1:
-            allele = list(possible_alleles)[0]
+            (allele,) = possible_alleles
             guaranteed[gene_name] = f"{allele}/{allele}"
 
     return guaranteed
@@ -620,6 +620,31 @@ class PhenotypeCalculator:
 
         return ctx.phenotype
 
+    def determine_phenotypes(self, genotypes: List[Dict[str, Tuple[str, str]]]) -> List[str]:
+        """
+        Determine phenotypes for many genotypes in one pass.
+
+        Equivalent to calling determine_phenotype() for each genotype, but
+        binds the pipeline and registry once for the whole batch.
+
+        Args:
+            genotypes: List of complete genotype dictionaries
+
+        Returns:
+            list: Phenotype names in the same order as the input
+        """
+        pipeline = self.pipeline
+        registry = self.registry
+        phenotypes = []
+
+        for genotype in genotypes:
+            ctx = PhenotypeContext(genotype, registry)
+            for modifier in pipeline:
+                modifier(ctx)
+            phenotypes.append(ctx.phenotype)
+
+        return phenotypes
+
     def add_modifier(
         self,
         modifier: Callable[[PhenotypeContext], None],
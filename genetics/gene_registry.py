@@ -8,15 +8,36 @@ Useful for game projects that might want to add custom genes or traits.
 """
 
 import random
+import re
 from typing import Dict, List, Tuple, Optional, Callable, Set
 from genetics.gene_definitions import (
     GeneDefinition,
     ALL_GENES,
     GENES_BY_NAME,
+    LETHAL_COMBINATIONS,
     get_gene,
     get_all_gene_names
 )
 
+# Wild-type/recessive allele per gene; genes not listed use their first allele
+_WILDTYPE_ALLELES = {
+    'extension': 'e',
+    'agouti': 'a',
+    'dilution': 'N',
+    'dun': 'nd2',
+    'kit': 'n',
+    'frame': 'n',
+    'splash': 'n',
+    'leopard': 'lp',
+    'gray': 'g',
+    'champagne': 'n',
+    'flaxen': 'f',
+    'sooty': 'sty'
+}
+
+# One "Symbol:allele/allele" entry of a genotype string
+_GENOTYPE_PART_RE = re.compile(r'([^\s:]+):([^\s/]+)/(\S+)')
+
 
 class GeneRegistry:
     """
@@ -40,6 +61,10 @@ class GeneRegistry:
             gene.name: gene for gene in genes
         }
         self._gene_order: List[str] = [gene.name for gene in genes]
+        # Symbol -> gene lookup for parsing; the first gene registered with a symbol wins
+        self._genes_by_symbol: Dict[str, GeneDefinition] = {}
+        for gene in genes:
+            self._genes_by_symbol.setdefault(gene.symbol, gene)
 
     def register_gene(self, gene: GeneDefinition) -> None:
         """
@@ -55,6 +80,7 @@ class GeneRegistry:
 
         self._genes[gene.name] = gene
         self._gene_order.append(gene.name)
+        self._genes_by_symbol.setdefault(gene.symbol, gene)
 
     def get_gene(self, name: str) -> GeneDefinition:
         """
@@ -232,7 +258,6 @@ class GeneRegistry:
             pair = gene.sort_alleles([allele1, allele2])
 
             # Check for lethal combinations (uses shared constant)
-            from genetics.gene_definitions import LETHAL_COMBINATIONS
             if gene.name in LETHAL_COMBINATIONS:
                 if pair in LETHAL_COMBINATIONS[gene.name]['genotypes']:
                     continue
@@ -255,22 +280,7 @@ class GeneRegistry:
         Returns:
             str: Wild-type allele (usually 'n', 'g', 'lp', 'e', 'a', etc.)
         """
-        # Map gene names to their wild-type alleles
-        wildtype_map = {
-            'extension': 'e',
-            'agouti': 'a',
-            'dilution': 'N',
-            'dun': 'nd2',
-            'kit': 'n',
-            'frame': 'n',
-            'splash': 'n',
-            'leopard': 'lp',
-            'gray': 'g',
-            'champagne': 'n',
-            'flaxen': 'f',
-            'sooty': 'sty'
-        }
-        return wildtype_map.get(gene.name, gene.alleles[0])
+        return _WILDTYPE_ALLELES.get(gene.name, gene.alleles[0])
 
     def _random_kit_allele(self, gene: GeneDefinition) -> str:
         """
@@ -447,6 +457,45 @@ class GeneRegistry:
 
         return offspring_genotype
 
+    def breed_batch(
+        self,
+        parent1_genotype: Dict[str, Tuple[str, str]],
+        parent2_genotype: Dict[str, Tuple[str, str]],
+        count: int
+    ) -> List[Dict[str, Tuple[str, str]]]:
+        """
+        Breed the same two genotypes several times.
+
+        Equivalent to calling breed() count times, but the parents are
+        validated once and the per-gene lookups are resolved up front.
+
+        Args:
+            parent1_genotype: Complete genotype dict for parent 1
+            parent2_genotype: Complete genotype dict for parent 2
+            count: Number of offspring genotypes to produce
+
+        Returns:
+            list: count offspring genotypes
+
+        Raises:
+            ValueError: If genotypes are invalid
+        """
+        self.validate_genotype(parent1_genotype)
+        self.validate_genotype(parent2_genotype)
+
+        loci = [
+            (gene_name, self._genes[gene_name].sort_alleles,
+             parent1_genotype[gene_name], parent2_genotype[gene_name])
+            for gene_name in self._gene_order
+        ]
+        choice = random.choice
+
+        return [
+            {gene_name: sort_alleles([choice(alleles1), choice(alleles2)])
+             for gene_name, sort_alleles, alleles1, alleles2 in loci}
+            for _ in range(count)
+        ]
+
     def format_genotype(
         self,
         genotype: Dict[str, Tuple[str, str]],
@@ -544,24 +593,13 @@ class GeneRegistry:
         genotype = {}
 
         try:
-            parts = genotype_str.strip().split()
-
-            for part in parts:
-                if ':' not in part:
-                    continue
-
-                symbol, alleles_str = part.split(':', 1)
-                alleles = alleles_str.split('/')
-
-                # Find gene by symbol
-                gene = None
-                for g in self._genes.values():
-                    if g.symbol == symbol:
-                        gene = g
-                        break
-
+            # Validation guarantees every entry has exactly two alleles, so one
+            # regex scan splits symbols and alleles; parts without ':' never match
+            genes_by_symbol = self._genes_by_symbol
+            for symbol, allele1, allele2 in _GENOTYPE_PART_RE.findall(genotype_str):
+                gene = genes_by_symbol.get(symbol)
                 if gene is not None:
-                    genotype[gene.name] = gene.sort_alleles(alleles)
+                    genotype[gene.name] = gene.sort_alleles([allele1, allele2])
 
             return genotype
 
@@ -19,7 +19,7 @@ Example usage:
     horse = Horse.from_string("E:E/e A:A/a Dil:N/Cr D:D/nd2 Z:n/n Ch:n/n F:F/f STY:sty/sty G:g/g")
 """
 
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from genetics.gene_registry import GeneRegistry, get_default_registry
 from genetics.gene_interaction import PhenotypeCalculator
 
@@ -40,6 +40,10 @@ class Horse:
     Provides a clean, fluent API for horse genetics operations.
     """
 
+    # Filled on first genotype_string access; the class default also covers
+    # horses built without __init__ (see _from_phenotyped)
+    _genotype_string: Optional[str] = None
+
     def __init__(
         self,
         genotype: Dict[str, Tuple[str, str]],
@@ -97,8 +101,10 @@ class Horse:
 
     @property
     def genotype_string(self) -> str:
-        """Get formatted genotype string (compact format)."""
-        return self.registry.format_genotype(self._genotype, compact=True)
+        """Get formatted genotype string (compact format), computed once per horse."""
+        if self._genotype_string is None:
+            self._genotype_string = self.registry.format_genotype(self._genotype, compact=True)
+        return self._genotype_string
 
     @property
     def genotype_detailed(self) -> str:
@@ -203,6 +209,44 @@ class Horse:
         genotype = reg.generate_random_genotype(excluded_genes, custom_probabilities)
         return cls(genotype, reg, calculator)
 
+    @classmethod
+    def random_batch(
+        cls,
+        count: int,
+        registry: Optional[GeneRegistry] = None,
+        calculator: Optional[PhenotypeCalculator] = None,
+        excluded_genes: Optional[set] = None,
+        custom_probabilities: Optional[dict] = None
+    ) -> List['Horse']:
+        """
+        Generate several random horses at once.
+
+        Equivalent to calling random() count times, but shares one registry
+        and calculator and resolves all phenotypes in a single batch.
+        Generated genotypes are valid and non-lethal by construction, so the
+        per-horse validation done by __init__ is skipped.
+
+        Args:
+            count: Number of horses to generate
+            registry: Gene registry (uses default if None)
+            calculator: Phenotype calculator (creates new if None)
+            excluded_genes: Set of gene names to exclude (force to wild-type)
+            custom_probabilities: Dict mapping gene names to custom probability of recessive allele
+
+        Returns:
+            List[Horse]: count new random horses
+
+        Example:
+            herd = Horse.random_batch(10, excluded_genes={'gray'})
+        """
+        reg = registry or get_default_registry()
+        calc = calculator or PhenotypeCalculator(reg)
+
+        generate = reg.generate_random_genotype
+        genotypes = [generate(excluded_genes, custom_probabilities) for _ in range(count)]
+
+        return cls._from_phenotyped(genotypes, calc.determine_phenotypes(genotypes), reg, calc)
+
     @classmethod
     def from_string(
         cls,
@@ -265,6 +309,79 @@ class Horse:
         genotype = data['genotype']
         return cls(genotype, registry, calculator, allow_lethal=allow_lethal)
 
+    @classmethod
+    def from_dict_batch(
+        cls,
+        data_list: List[dict],
+        registry: Optional[GeneRegistry] = None,
+        calculator: Optional[PhenotypeCalculator] = None,
+        allow_lethal: bool = False
+    ) -> List['Horse']:
+        """
+        Create many horses from dictionaries in one pass.
+
+        Faster than calling from_dict() in a loop for large imports: the
+        registry and calculator are resolved once and all phenotypes are
+        calculated as a single batch. Allele lists (as produced by JSON
+        parsers) are converted to tuples.
+
+        Args:
+            data_list: List of dictionaries with 'genotype' key
+            registry: Gene registry (uses default if None)
+            calculator: Phenotype calculator (creates new if None)
+            allow_lethal: If False (default), raises LethalGenotypeError
+                if any genotype is lethal.
+
+        Returns:
+            list: New horses in the same order as data_list
+
+        Raises:
+            LethalGenotypeError: If a genotype is lethal and allow_lethal is False
+
+        Example:
+            horses = Horse.from_dict_batch(json.load(f))
+        """
+        reg = registry or get_default_registry()
+        calc = calculator or PhenotypeCalculator(reg)
+
+        genotypes = []
+        for data in data_list:
+            genotype = {gene: tuple(alleles) for gene, alleles in data['genotype'].items()}
+            reg.validate_genotype(genotype)
+            genotypes.append(genotype)
+
+        if not allow_lethal:
+            from genetics.validation import check_lethal_genotype
+            for i, genotype in enumerate(genotypes):
+                lethal_reason = check_lethal_genotype(genotype)
+                if lethal_reason:
+                    raise LethalGenotypeError(
+                        f"Lethal genotype at index {i}: {lethal_reason}. "
+                        f"Use allow_lethal=True to create this horse explicitly."
+                    )
+
+        return cls._from_phenotyped(genotypes, calc.determine_phenotypes(genotypes), reg, calc)
+
+    @classmethod
+    def _from_phenotyped(
+        cls,
+        genotypes: List[Dict[str, Tuple[str, str]]],
+        phenotypes: List[str],
+        registry: GeneRegistry,
+        calculator: PhenotypeCalculator
+    ) -> List['Horse']:
+        """Build horses from already validated and phenotyped genotypes, skipping __init__."""
+        horses = []
+        for genotype, phenotype in zip(genotypes, phenotypes):
+            horse = cls.__new__(cls)
+            horse.registry = registry
+            horse.calculator = calculator
+            horse._genotype = genotype
+            horse._phenotype = phenotype
+            horses.append(horse)
+
+        return horses
+
     @classmethod
     def breed(
         cls,
@@ -299,6 +416,41 @@ class Horse:
         offspring_genotype = reg.breed(parent1._genotype, parent2._genotype)
         return cls(offspring_genotype, reg, calculator, allow_lethal=True)
 
+    @classmethod
+    def breed_batch(
+        cls,
+        parent1: 'Horse',
+        parent2: 'Horse',
+        count: int,
+        registry: Optional[GeneRegistry] = None,
+        calculator: Optional[PhenotypeCalculator] = None
+    ) -> List['Horse']:
+        """
+        Breed the same two horses several times.
+
+        Equivalent to calling breed() count times, but the parents are
+        validated once and all phenotypes are resolved in a single batch.
+        Like breed(), lethal offspring are allowed.
+
+        Args:
+            parent1: First parent
+            parent2: Second parent
+            count: Number of foals to produce
+            registry: Gene registry (uses default if None)
+            calculator: Phenotype calculator (creates new if None)
+
+        Returns:
+            List[Horse]: count offspring horses (check .is_lethal for viability)
+
+        Example:
+            foals = Horse.breed_batch(mare, stallion, 20)
+        """
+        reg = registry or get_default_registry()
+        calc = calculator or PhenotypeCalculator(reg)
+
+        genotypes = reg.breed_batch(parent1._genotype, parent2._genotype, count)
+        return cls._from_phenotyped(genotypes, calc.determine_phenotypes(genotypes), reg, calc)
+
 
 # ============================================================================
 # CONVENIENCE FUNCTIONS - Alternative API style
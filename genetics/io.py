@@ -19,8 +19,10 @@ Example usage:
 """
 
 import json
-from typing import List, Dict, Any
-from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Any
+
+if TYPE_CHECKING:
+    from genetics.horse import Horse
 
 
 def save_horses_to_json(horses: List['Horse'], filename: str, pretty: bool = True) -> None:
@@ -197,7 +199,7 @@ def import_breeding_records(filename: str) -> List[Dict[str, Any]]:
     return records
 
 
-def horses_to_csv(horses: List['Horse'], filename: str, include_genotype: bool = True) -> None:
+def horses_to_csv(horses: List['Horse'], filename, include_genotype: bool = True) -> None:
     """
     Export horses to CSV format.
 
@@ -205,7 +207,8 @@ def horses_to_csv(horses: List['Horse'], filename: str, include_genotype: bool =
 
     Args:
         horses: List of Horse objects
-        filename: Output CSV file
+        filename: Output CSV file path, or a writable text stream
+            (e.g. io.StringIO) to export without touching the disk
         include_genotype: If True, include full genotype string (default: True)
 
     Example:
@@ -214,30 +217,38 @@ def horses_to_csv(horses: List['Horse'], filename: str, include_genotype: bool =
         >>> horses = [Horse.random() for _ in range(100)]
         >>> horses_to_csv(horses, 'horses.csv')  # doctest: +SKIP
     """
+    if hasattr(filename, 'write'):
+        _write_horses_csv(horses, filename, include_genotype)
+    else:
+        with open(filename, 'w', newline='') as f:
+            _write_horses_csv(horses, f, include_genotype)
+
+
+def _write_horses_csv(horses: List['Horse'], f, include_genotype: bool) -> None:
+    """Write the horses_to_csv rows to an open text stream."""
     import csv
 
-    with open(filename, 'w', newline='') as f:
-        fieldnames = ['phenotype']
-        if include_genotype:
-            fieldnames.append('genotype')
+    fieldnames = ['phenotype']
+    if include_genotype:
+        fieldnames.append('genotype')
 
-        # Add individual gene columns
-        if horses:
-            first_horse = horses[0]
-            for gene_name in first_horse.genotype.keys():
-                fieldnames.append(f'gene_{gene_name}')
+    # Add individual gene columns
+    if horses:
+        first_horse = horses[0]
+        for gene_name in first_horse.genotype.keys():
+            fieldnames.append(f'gene_{gene_name}')
 
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    writer = csv.DictWriter(f, fieldnames=fieldnames)
+    writer.writeheader()
 
-        for horse in horses:
-            row = {'phenotype': horse.phenotype}
+    for horse in horses:
+        row = {'phenotype': horse.phenotype}
 
-            if include_genotype:
-                row['genotype'] = horse.genotype_string
+        if include_genotype:
+            row['genotype'] = horse.genotype_string
 
-            # Add individual genes
-            for gene_name, alleles in horse.genotype.items():
-                row[f'gene_{gene_name}'] = '/'.join(alleles)
+        # Add individual genes
+        for gene_name, alleles in horse.genotype.items():
+            row[f'gene_{gene_name}'] = '/'.join(alleles)
 
-            writer.writerow(row)
+        writer.writerow(row)
@@ -31,10 +31,15 @@ Example usage:
 """
 
 from typing import Dict, List, Optional, Tuple, Set
+from collections import Counter
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
 import hashlib
 import json
 
+_by_generation_key = attrgetter('generation')
+
 
 class PedigreeNode:
     """Represents a horse in the pedigree tree."""
@@ -107,6 +112,31 @@ class PedigreeTree:
         self.horses: Dict[str, PedigreeNode] = {}
         self.breedings: List[Tuple[str, str, str]] = []  # (sire_id, dam_id, foal_id)
 
+        # Aggregates maintained by add_horse() so callers don't rescan all horses
+        self._max_generation = 0
+        self._foundation_count = 0
+
+    @property
+    def max_generation(self) -> int:
+        """Highest generation number in the tree (0 if empty)."""
+        return self._max_generation
+
+    @property
+    def foundation_count(self) -> int:
+        """Number of horses without a recorded sire or dam."""
+        return self._foundation_count
+
+    def horses_by_generation(self) -> Dict[int, List[PedigreeNode]]:
+        """
+        Group all horses by generation number.
+
+        Returns:
+            dict: {generation: [PedigreeNode]} in ascending generation order,
+            horses within a generation in insertion order
+        """
+        ordered = sorted(self.horses.values(), key=_by_generation_key)
+        return {gen: list(horses) for gen, horses in groupby(ordered, key=_by_generation_key)}
+
     def add_horse(
         self,
         horse_id: str,
@@ -142,7 +172,20 @@ class PedigreeTree:
             dam_id=dam_id
         )
 
+        # Keep aggregates in sync, accounting for a replaced node
+        old = self.horses.get(horse_id)
+        if old is not None and old.sire_id is None and old.dam_id is None:
+            self._foundation_count -= 1
+        if sire_id is None and dam_id is None:
+            self._foundation_count += 1
+
         self.horses[horse_id] = node
+
+        if generation >= self._max_generation:
+            self._max_generation = generation
+        elif old is not None and old.generation == self._max_generation:
+            self._max_generation = max(h.generation for h in self.horses.values())
+
         return node
 
     def add_breeding(
@@ -295,23 +338,29 @@ class PedigreeTree:
 
         return descendants
 
-    def detect_inbreeding(self, horse_id: str, depth: int = 3) -> Dict[str, int]:
+    def detect_inbreeding(
+        self,
+        horse_id: str,
+        depth: int = 3,
+        ancestors: Optional[List[PedigreeNode]] = None
+    ) -> Dict[str, int]:
         """
         Detect inbreeding by finding duplicate ancestors.
 
         Args:
             horse_id: Horse ID to check
             depth: How many generations to check
+            ancestors: Result of get_ancestors(horse_id, depth) if the caller
+                already has it; skips a second traversal
 
         Returns:
             dict: {ancestor_id: number_of_occurrences} for ancestors appearing multiple times
         """
-        ancestors = self.get_ancestors(horse_id, depth)
-        ancestor_ids = [a.horse_id for a in ancestors]
+        if ancestors is None:
+            ancestors = self.get_ancestors(horse_id, depth)
 
         # Count occurrences
-        from collections import Counter
-        counts = Counter(ancestor_ids)
+        counts = Counter(a.horse_id for a in ancestors)
 
         # Return only duplicates
         inbreeding = {aid: count for aid, count in counts.items() if count > 1}
@@ -330,19 +379,11 @@ class PedigreeTree:
             f.write("PEDIGREE TREE\n")
             f.write("=" * 80 + "\n\n")
 
-            # Group by generation
-            by_generation = {}
-            for horse in self.horses.values():
-                gen = horse.generation
-                if gen not in by_generation:
-                    by_generation[gen] = []
-                by_generation[gen].append(horse)
-
             # Write each generation
-            for gen in sorted(by_generation.keys()):
+            for gen, horses in self.horses_by_generation().items():
                 f.write(f"\n--- Generation {gen} ---\n\n")
 
-                for horse in by_generation[gen]:
+                for horse in horses:
                     f.write(f"{horse.name} - {horse.phenotype}\n")
                     f.write(f"  ID: {horse.horse_id}\n")
                     f.write(f"  Genotype: {horse.genotype_string}\n")
@@ -411,16 +452,11 @@ class PedigreeTree:
         ax.axis('off')
 
         # Group horses by generation
-        by_generation = {}
-        for horse in self.horses.values():
-            gen = horse.generation
-            if gen not in by_generation:
-                by_generation[gen] = []
-            by_generation[gen].append(horse)
+        by_generation = self.horses_by_generation()
 
         # Calculate positions
         positions = {}
-        max_gen = max(by_generation.keys()) or 1  # Avoid ZeroDivisionError
+        max_gen = self.max_generation or 1  # Avoid ZeroDivisionError
 
         for gen, horses in by_generation.items():
             y = 9 - (gen / max_gen) * 8  # Top to bottom
@@ -488,7 +524,12 @@ class PedigreeTree:
 
         # Load horses
         for horse_id, horse_data in data['horses'].items():
-            tree.horses[horse_id] = PedigreeNode.from_dict(horse_data)
+            node = PedigreeNode.from_dict(horse_data)
+            tree.horses[horse_id] = node
+            if node.sire_id is None and node.dam_id is None:
+                tree._foundation_count += 1
+            if node.generation > tree._max_generation:
+                tree._max_generation = node.generation
 
         # Load breedings
         tree.breedings = [
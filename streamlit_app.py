@@ -16,6 +16,7 @@ Or with Docker:
 
 import os
 import streamlit as st
+import altair as alt
 from genetics.horse import Horse
 from genetics.breeding_stats import calculate_offspring_probabilities
 from genetics.gene_registry import get_default_registry
@@ -30,10 +31,74 @@ import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch
 import io
 import csv
+import functools
+from collections import Counter
+from itertools import groupby, islice
+
+try:
+    import orjson  # Optional: faster JSON for large stable files (load and save)
+except ImportError:
+    orjson = None
+
+# Column width specs shared by page layouts
+_COL_1_2 = (1, 2)
+_COL_3_1 = (3, 1)
+_COL_1_2_1 = (1, 2, 1)
+_COL_GENE_ROW = (2, 2, 2, 1)  # Compare page: gene | horse 1 | horse 2 | status
+
+# Page-wide styles, injected once per run below st.set_page_config
+_CSS = """
+<style>
+    h1 {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+    .horse-card {
+        padding: 1.5rem;
+        border-radius: 10px;
+        margin-bottom: 1rem;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+    .stat-box {
+        padding: 1rem;
+        border-radius: 8px;
+        background: #f8f9fa;
+        border-left: 4px solid #667eea;
+    }
+    .success-box {
+        padding: 1rem;
+        border-radius: 8px;
+        background: #d4edda;
+        border-left: 4px solid #28a745;
+        color: #155724;
+    }
+    .pedigree-box {
+        padding: 1rem;
+        border-radius: 8px;
+        background: #f8f9fa;
+        border: 2px solid #667eea;
+        margin: 0.5rem 0;
+    }
+    .ancestor-box {
+        padding: 0.8rem;
+        border-radius: 6px;
+        background: #e9ecef;
+        margin: 0.3rem 0;
+        border-left: 3px solid #6c757d;
+    }
+    .card-grid {
+        display: grid;
+        gap: 0 1rem;
+        margin-bottom: 1.5rem;
+    }
+</style>
+"""
 
 # Load translations
+@functools.lru_cache(maxsize=None)
 def load_translations(lang='en'):
-    """Load translation file for the specified language."""
+    """Load translation file for the specified language (read once per process)."""
     locale_path = os.path.join(os.path.dirname(__file__), 'locales', f'{lang}.json')
     try:
         with open(locale_path, 'r', encoding='utf-8') as f:
@@ -44,10 +109,29 @@ def load_translations(lang='en'):
         with open(fallback_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
+@functools.lru_cache(maxsize=4096)
+def _lookup_translation(key, lang='en'):
+    """Resolve a dot-notation key to its raw (unformatted) translation value."""
+    translations = load_translations(lang)
+
+    # Navigate through nested dict using dot notation
+    keys = key.split('.')
+    value = translations
+    for k in keys:
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return key  # Return key if translation not found
+
+    return value
+
 def t(key, lang='en', **kwargs):
     """
     Get translation for a dot-notation key.
 
+    The key lookup is memoized per (key, lang); placeholders are filled in
+    afterwards so calls with changing values don't fill the cache.
+
     Args:
         key: Dot-notation key like "nav.generator"
         lang: Language code (default 'en')
@@ -56,16 +140,7 @@ def t(key, lang='en', **kwargs):
     Returns:
         Translated string with placeholders replaced
     """
-    translations = load_translations(lang)
-
-    # Navigate through nested dict using dot notation
-    keys = key.split('.')
-    value = translations
-    for k in keys:
-        if isinstance(value, dict) and k in value:
-            value = value[k]
-        else:
-            return key  # Return key if translation not found
+    value = _lookup_translation(key, lang)
 
     # Replace placeholders
     if isinstance(value, str) and kwargs:
@@ -76,6 +151,54 @@ def t(key, lang='en', **kwargs):
 
     return value
 
+@st.cache_data(show_spinner=False)
+def _section_strings(section, lang='en'):
+    """
+    Translate every key of a locale section at once.
+
+    Used by static pages (About, footer) so each rerun does a single cached
+    lookup instead of one t() call per string.
+
+    Args:
+        section: Top-level locale section, e.g. "about"
+        lang: Language code
+
+    Returns:
+        dict: {key: translated string}; keys follow the English locale
+    """
+    return {key: t(f'{section}.{key}', lang) for key in t(section, 'en')}
+
+@st.cache_resource
+def _registry_and_calculator():
+    """
+    Shared gene registry and phenotype calculator for the whole process.
+
+    Both are read-only after construction, so one instance is safely reused
+    across reruns and sessions.
+
+    Returns:
+        tuple: (GeneRegistry, PhenotypeCalculator)
+    """
+    registry = get_default_registry()
+    return registry, PhenotypeCalculator(registry)
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def _offspring_probabilities(genotype1, genotype2):
+    """
+    Cached calculate_offspring_probabilities() for a pair of genotype strings.
+
+    Args:
+        genotype1: Parent 1 genotype string
+        genotype2: Parent 2 genotype string
+
+    Returns:
+        dict: {phenotype: probability}, most likely first
+    """
+    registry, calculator = _registry_and_calculator()
+    return calculate_offspring_probabilities(
+        genotype1, genotype2, registry=registry, calculator=calculator
+    )
+
 def generate_random_horse_name() -> str:
     """
     Generate a random horse name by combining prefixes and suffixes.
@@ -197,9 +320,13 @@ def check_breeding_risks(parent1, parent2):
     """
     risks = []
 
+    # Horse.genotype returns a copy, so take it once per parent
+    genotype1 = parent1.genotype
+    genotype2 = parent2.genotype
+
     # Check Frame Overo (LWOS risk)
-    parent1_frame = parent1.genotype.get('frame', ('n', 'n'))
-    parent2_frame = parent2.genotype.get('frame', ('n', 'n'))
+    parent1_frame = genotype1.get('frame', ('n', 'n'))
+    parent2_frame = genotype2.get('frame', ('n', 'n'))
 
     if 'O' in parent1_frame and 'O' in parent2_frame:
         risks.append({
@@ -210,8 +337,8 @@ def check_breeding_risks(parent1, parent2):
 
     # Check Dominant White lethal combinations
     lethal_w_alleles = ['W1', 'W5', 'W10', 'W13', 'W22']
-    parent1_w = parent1.genotype.get('kit', ('n', 'n'))
-    parent2_w = parent2.genotype.get('kit', ('n', 'n'))
+    parent1_w = genotype1.get('kit', ('n', 'n'))
+    parent2_w = genotype2.get('kit', ('n', 'n'))
 
     parent1_has_lethal_w = any(allele in lethal_w_alleles for allele in parent1_w)
     parent2_has_lethal_w = any(allele in lethal_w_alleles for allele in parent2_w)
@@ -237,6 +364,24 @@ def check_breeding_risks(parent1, parent2):
         return {'has_risk': False, 'risks': []}
 
 
+def group_ancestors_by_distance(horse, ancestors):
+    """
+    Group ancestors by how many generations they are above a horse.
+
+    Args:
+        horse: PedigreeNode the ancestors belong to
+        ancestors: List of ancestor PedigreeNodes (e.g. from get_ancestors)
+
+    Returns:
+        dict: {distance: [PedigreeNode]} in ascending distance order
+    """
+    def distance(ancestor):
+        return horse.generation - ancestor.generation
+
+    ordered = sorted(ancestors, key=distance)
+    return {dist: list(group) for dist, group in groupby(ordered, key=distance)}
+
+
 def generate_pedigree_tree_image(pedigree_tree, horse_id, depth=3):
     """
     Generate a modern, beautiful pedigree tree using matplotlib.
@@ -253,18 +398,13 @@ def generate_pedigree_tree_image(pedigree_tree, horse_id, depth=3):
     ancestors = pedigree_tree.get_ancestors(horse_id, depth)
 
     # Organize horses by generation
-    by_generation = {0: [selected_horse]}
-    for ancestor in ancestors:
-        gen_dist = selected_horse.generation - ancestor.generation
-        if gen_dist not in by_generation:
-            by_generation[gen_dist] = []
-        by_generation[gen_dist].append(ancestor)
+    by_generation = {0: [selected_horse], **group_ancestors_by_distance(selected_horse, ancestors)}
 
     # Create figure with modern styling
     fig, ax = plt.subplots(figsize=(16, 12), facecolor='#f8f9fa')
     ax.set_facecolor('#f8f9fa')
     ax.set_xlim(-0.7, depth + 0.7)
-    ax.set_ylim(-1.5, len(by_generation.get(max(by_generation.keys()), [])) + 1.5)
+    ax.set_ylim(-1.5, len(by_generation.get(max(by_generation), [])) + 1.5)
     ax.axis('off')
 
     # Calculate positions for each horse
@@ -431,12 +571,12 @@ def generate_pedigree_tree_image(pedigree_tree, horse_id, depth=3):
 
     return buf
 
-def export_horses_to_csv(horses_list):
+def export_horses_to_csv(stable):
     """
     Export horses to CSV format.
 
     Args:
-        horses_list: List of horse items from session state
+        stable: Stable columns dict (see new_stable())
 
     Returns:
         CSV string
@@ -456,16 +596,15 @@ def export_horses_to_csv(horses_list):
     writer.writerow(header)
 
     # Write horse data
-    for item in horses_list:
-        horse = item['horse']
-        name = item['name']
-        generated_at = item.get('generated_at', '')
-        has_parents = 'Yes' if 'parents' in item else 'No'
+    for horse, name, generated_at, parents in zip(
+        stable['horses'], stable['names'], stable['generated_at'], stable['parents']
+    ):
+        has_parents = 'Yes' if parents is not None else 'No'
 
         row = [name, horse.phenotype]
+        genotype = horse.genotype  # property returns a copy; take it once per horse
         for gene in gene_keys:
-            alleles = horse.genotype.get(gene, ('', ''))
-            row.append('/'.join(alleles))
+            row.append('/'.join(genotype.get(gene, ('', ''))))
         row.extend([has_parents, generated_at])
         writer.writerow(row)
 
@@ -479,10 +618,9 @@ def import_horses_from_csv(csv_content):
         csv_content: CSV file content as string or bytes
 
     Returns:
-        List of horse items for session state
+        Stable columns dict (see new_stable()) with the imported horses
     """
-    registry = get_default_registry()
-    calculator = PhenotypeCalculator(registry)
+    registry, calculator = _registry_and_calculator()
 
     # All 14 gene keys with their default (wild-type homozygous) alleles
     gene_defaults = {
@@ -502,10 +640,12 @@ def import_horses_from_csv(csv_content):
         'patn1': ('n', 'n'),
     }
 
-    horses_list = []
+    imported = new_stable()
     if isinstance(csv_content, bytes):
         csv_content = csv_content.decode('utf-8')
     reader = csv.DictReader(io.StringIO(csv_content))
+    # Fallback timestamp for rows without one, formatted once for the whole file
+    imported_at = datetime.now().isoformat()
 
     for row in reader:
         # Build genotype dict from CSV columns
@@ -519,18 +659,617 @@ def import_horses_from_csv(csv_content):
                 genotype[gene] = default
 
         # Create horse (constructor calculates phenotype automatically)
-        horse = Horse(genotype, registry, calculator)
+        imported['horses'].append(Horse(genotype, registry, calculator))
+        imported['names'].append(row.get('Name', 'Imported Horse'))
+        imported['generated_at'].append(row.get('Generated_At', imported_at))
+        imported['parents'].append(None)
 
-        # Create item
-        item = {
-            'horse': horse,
-            'name': row.get('Name', 'Imported Horse'),
-            'generated_at': row.get('Generated_At', datetime.now().isoformat())
-        }
+    return imported
+
+def horizontal_bar_chart(labels, values, texts, value_title=''):
+    """
+    Build a single horizontal bar chart for a ranked list of values.
 
-        horses_list.append(item)
+    One chart replaces a column pair + st.progress per row.
+
+    Args:
+        labels: Bar labels (y axis), in display order
+        values: Bar lengths (x axis)
+        texts: Text shown at the end of each bar
+        value_title: Title of the value axis
+
+    Returns:
+        Altair chart
+    """
+    data = alt.Data(values=[
+        {'label': label, 'value': value, 'text': text}
+        for label, value, text in zip(labels, values, texts)
+    ])
+    base = alt.Chart(data).encode(
+        y=alt.Y('label:N', sort=None, title=None, axis=alt.Axis(labelLimit=250)),
+        x=alt.X('value:Q', title=value_title),
+    )
+    bars = base.mark_bar(color='#667eea')
+    text = base.mark_text(align='left', dx=4).encode(text='text:N')
+    return (bars + text).properties(height=max(len(labels) * 28, 60))
 
-    return horses_list
+def _sorted_freqs(items):
+    """
+    Precompute each allele's share of the total count.
+
+    Args:
+        items: Tuple of (allele, count) pairs, most common first
+            (as returned by Counter.most_common())
+
+    Returns:
+        tuple: (total_count, [(allele, count, fraction), ...]) most common first
+    """
+    total = sum(c for _, c in items)
+    inv_total = 1.0 / total
+    return total, [(a, c, c * inv_total) for a, c in items]
+
+def _diversity_score(n_phenotypes, total_horses, allele_lens):
+    """
+    Overall stable diversity score (0-100).
+
+    Averages the phenotype variety ratio with the mean number of distinct
+    alleles per gene (scaled by 1/10).
+
+    Args:
+        n_phenotypes: Number of distinct phenotypes
+        total_horses: Number of horses in the stable
+        allele_lens: Tuple with the number of distinct alleles for each gene
+
+    Returns:
+        int: Diversity score
+    """
+    # ((P/H + S/G/10) / 2) * 100 == 5 * (10*P*G + S*H) / (H*G), done in integers
+    n_genes = len(allele_lens)
+    num = 5 * (10 * n_phenotypes * n_genes + sum(allele_lens) * total_horses)
+    return num // (total_horses * n_genes)
+
+def page_header(icon, title, subtitle):
+    """
+    Render a page title and subtitle with native Streamlit elements.
+
+    Args:
+        icon: Emoji shown before the title
+        title: Translated page title
+        subtitle: Translated page subtitle
+    """
+    st.title(f"{icon} {title}", anchor=False)
+    st.caption(subtitle)
+
+def new_stable():
+    """
+    Create an empty stable.
+
+    The stable is stored column-wise: parallel lists where index i of each
+    list describes the same horse.
+
+    Returns:
+        dict: {'horses': [Horse], 'names': [str], 'generated_at': [str],
+        'parents': [(sire_idx, dam_idx) or None]}
+    """
+    return {'horses': [], 'names': [], 'generated_at': [], 'parents': []}
+
+def add_to_stable(horse, name, generated_at, parents=None):
+    """
+    Append one horse to the session stable.
+
+    Args:
+        horse: Horse object
+        name: Display name
+        generated_at: ISO timestamp string
+        parents: Optional (sire_idx, dam_idx) tuple for bred horses
+    """
+    stable = st.session_state.stable
+    stable['horses'].append(horse)
+    stable['names'].append(name)
+    stable['generated_at'].append(generated_at)
+    stable['parents'].append(parents)
+
+def extend_stable(horses, names, generated_at, parents=None):
+    """
+    Append many horses to the session stable.
+
+    Args:
+        horses: List of Horse objects
+        names: Display names, same length as horses
+        generated_at: ISO timestamp strings, same length as horses
+        parents: Optional list of (sire_idx, dam_idx) or None per horse
+    """
+    stable = st.session_state.stable
+    stable['horses'].extend(horses)
+    stable['names'].extend(names)
+    stable['generated_at'].extend(generated_at)
+    stable['parents'].extend(parents if parents is not None else [None] * len(horses))
+
+def mark_stable_changed():
+    """Bump the stable version so derived per-session caches are rebuilt, and refresh n_horses."""
+    st.session_state.stable_version = st.session_state.get('stable_version', 0) + 1
+    st.session_state.n_horses = len(st.session_state.stable['horses'])
+
+def mark_pedigree_changed():
+    """Bump the pedigree version so cached pedigree renders are rebuilt, and refresh n_pedigree."""
+    st.session_state.pedigree_version = st.session_state.get('pedigree_version', 0) + 1
+    st.session_state.n_pedigree = len(st.session_state.pedigree.horses)
+
+def session_memo(name, version, build):
+    """
+    Return a value cached in session state until its version changes.
+
+    st.cache_data is shared between all sessions, so per-user derived data
+    (indexes over the stable, name lists, ...) is memoized here instead.
+
+    Args:
+        name: Cache slot name
+        version: Version the cached value belongs to (e.g. stable_version)
+        build: Zero-argument callable computing the value on a miss
+
+    Returns:
+        Cached or freshly built value
+    """
+    memo = st.session_state.setdefault('_memo', {})
+    entry = memo.get(name)
+    if entry is None or entry[0] != version:
+        entry = (version, build())
+        memo[name] = entry
+    return entry[1]
+
+def build_stable_indexes(stable):
+    """
+    Build lookup indexes over the stable in a single pass.
+
+    Args:
+        stable: Stable columns dict (see new_stable())
+
+    Returns:
+        Dict with 'phenotype_counts' (Counter of phenotypes) and 'bred' /
+        'foundation' (sets of horse indexes)
+    """
+    phenotype_counts = Counter()
+    bred = set()
+    foundation = set()
+    for idx, (horse, parents) in enumerate(zip(stable['horses'], stable['parents'])):
+        phenotype_counts[horse.phenotype] += 1
+        (bred if parents is not None else foundation).add(idx)
+
+    return {
+        'phenotype_counts': phenotype_counts,
+        'bred': bred,
+        'foundation': foundation,
+    }
+
+def build_gene_stats(horses):
+    """
+    Tally alleles per gene across the stable.
+
+    Args:
+        horses: Non-empty list of Horse objects
+
+    Returns:
+        Dict with 'all_genes' (gene names), 'gene_alleles' (gene -> Counter
+        of alleles) and 'allele_lens' (distinct alleles per gene, as a tuple)
+    """
+    all_genes = list(horses[0].genotype.keys())
+    gene_alleles = {gene_name: Counter() for gene_name in all_genes}
+
+    for horse in horses:
+        for gene_name, alleles in horse.genotype.items():
+            gene_alleles[gene_name].update(alleles)
+
+    return {
+        'all_genes': all_genes,
+        'gene_alleles': gene_alleles,
+        'allele_lens': tuple(len(gene_alleles[gene_name]) for gene_name in all_genes),
+    }
+
+def get_stable_indexes():
+    """Return build_stable_indexes() for the current stable, cached per stable_version."""
+    return session_memo(
+        'stable_indexes',
+        st.session_state.stable_version,
+        lambda: build_stable_indexes(st.session_state.stable)
+    )
+
+def get_gene_stats():
+    """Return build_gene_stats() for the current stable, cached per stable_version."""
+    return session_memo(
+        'gene_stats',
+        st.session_state.stable_version,
+        lambda: build_gene_stats(st.session_state.stable['horses'])
+    )
+
+def get_horse_labels():
+    """Return the "name - phenotype" selectbox labels, cached per stable_version."""
+    stable = st.session_state.stable
+    return session_memo(
+        'horse_labels',
+        st.session_state.stable_version,
+        lambda: [f"{name} - {horse.phenotype}"
+                 for horse, name in zip(stable['horses'], stable['names'])]
+    )
+
+def _save_rename(idx):
+    """Widget callback: store the edited name of horse idx and mark the stable changed."""
+    new_name = st.session_state[f"rename_{idx}"].strip()
+    names = st.session_state.stable['names']
+    if new_name and new_name != names[idx]:
+        names[idx] = new_name
+        mark_stable_changed()
+
+def _random_rename(idx):
+    """Button callback: give horse idx a random name and mirror it in the rename input."""
+    new_name = generate_random_horse_name()
+    st.session_state.stable['names'][idx] = new_name
+    st.session_state[f"rename_{idx}"] = new_name
+    mark_stable_changed()
+
+def _suggest_foal_name():
+    """Button callback: store a random name suggestion for the next foal."""
+    st.session_state.suggested_foal_name = generate_random_horse_name()
+
+def _clear_stable():
+    """Button callback: empty the stable and the pedigree before the rerun renders them."""
+    st.session_state.stable = new_stable()
+    st.session_state.pedigree = PedigreeTree()
+    mark_stable_changed()
+    mark_pedigree_changed()
+
+def rename_horse_dialog(idx, lang='en'):
+    """
+    Body of the on-demand rename dialog for a single stable horse.
+
+    Wrapped with st.dialog on the stable page so the rename widgets are only
+    created for the horse being renamed instead of once per listed horse.
+
+    Args:
+        idx: Index of the horse in the session stable
+        lang: Language code
+    """
+    stable = st.session_state.stable
+    st.markdown(f"**🐴 {stable['names'][idx]}** - {stable['horses'][idx].phenotype}")
+
+    # The callback commits the name; no explicit rerun per edit is needed
+    st.text_input(
+        f"✏️ {t('stable.rename', lang)}",
+        value=stable['names'][idx],
+        key=f"rename_{idx}",
+        on_change=_save_rename,
+        args=(idx,)
+    )
+
+    col_save, col_random = st.columns(2)
+    with col_save:
+        # Pending edits are committed by the text input callback before this runs
+        if st.button(t('stable.save_name', lang), type="primary", use_container_width=True):
+            st.rerun()
+    with col_random:
+        # Renames in the callback; the dialog stays open showing the new name
+        st.button(t('stable.generate_random_name', lang), use_container_width=True,
+                  on_click=_random_rename, args=(idx,))
+
+@st.fragment
+def render_stable_list(filtered_idx, lang='en'):
+    """
+    Render one page of the stable as expanders with rename buttons.
+
+    Runs as a fragment, so paging and opening the rename dialog only rerun
+    the list, not the filters, downloads and metrics above it.
+
+    Args:
+        filtered_idx: Stable indices that passed the filters, in display order
+        lang: Language code
+    """
+    stable = st.session_state.stable
+    horses, names, parents_col = stable['horses'], stable['names'], stable['parents']
+
+    # Paginate so only one page of expanders/widgets is built per rerun
+    page_size = 25
+    n_pages = (len(filtered_idx) + page_size - 1) // page_size
+    page_n = 1
+    if n_pages > 1:
+        page_n = st.number_input(t('stable.page', lang), min_value=1, max_value=n_pages, value=1, step=1)
+        st.caption(t('stable.page_count', lang, page=page_n, pages=n_pages))
+
+    rename_target = None
+    for idx in filtered_idx[(page_n - 1) * page_size:page_n * page_size]:
+        horse = horses[idx]
+        name = names[idx]
+        parents = parents_col[idx]
+
+        with st.expander(f"🐴 {name} - {horse.phenotype}"):
+            st.markdown(f"**🎨 {t('stable.phenotype_label', lang)}:** {horse.phenotype}")
+
+            with st.expander("🧬 Genotype", expanded=False):
+                st.code(horse.genotype_string, language="text")
+
+                if parents is not None:
+                    st.markdown(f"**👪 {t('stable.parents_label', lang)}:**")
+                    st.caption(f"👨 {names[parents[0]]}  \n👩 {names[parents[1]]}")
+                else:
+                    st.info(f"✨ {t('stable.foundation_horse', lang)}")
+
+            # Rename option (opens a dialog instead of an inline text input)
+            if st.button(f"✏️ {t('stable.rename', lang)}", key=f"rename_btn_{idx}"):
+                rename_target = idx
+
+    # Open the rename dialog once for the selected horse; saving reruns the whole app
+    if rename_target is not None:
+        st.dialog(f"✏️ {t('stable.rename', lang)}")(rename_horse_dialog)(rename_target, lang)
+
+@st.fragment
+def render_gene_diversity(gene_alleles, all_genes, total_horses, lang='en'):
+    """
+    Render pattern gene prevalence and per-gene allele frequency details.
+
+    Runs as a fragment, so toggling its view only reruns this section.
+
+    Args:
+        gene_alleles: Dict of gene name -> Counter of alleles
+        all_genes: Gene names in display order
+        total_horses: Number of horses in the stable
+        lang: Language code
+    """
+    # Pattern Gene Prevalence Chart
+    st.markdown("#### 🎨 Pattern Gene Prevalence")
+    st.caption("Shows percentage of horses carrying at least one copy of each pattern gene")
+
+    # Calculate prevalence for pattern genes
+    pattern_genes = ['gray', 'kit', 'frame',
+                    'splash', 'leopard', 'champagne']
+    pattern_prevalence = {}
+    pct_per_horse = 100.0 / total_horses
+
+    for gene_name in pattern_genes:
+        if gene_name not in all_genes:
+            continue
+
+        # Count horses with at least one dominant allele
+        horses_with_pattern = 0
+        for horse in st.session_state.stable['horses']:
+            alleles = horse.get_gene(gene_name)
+            # Check if horse has dominant allele (not wild-type)
+            has_dominant = False
+
+            if gene_name == 'gray':
+                has_dominant = 'G' in alleles
+            elif gene_name == 'kit':
+                has_dominant = any(a != 'n' for a in alleles)
+            elif gene_name == 'frame':
+                has_dominant = 'O' in alleles
+            elif gene_name == 'splash':
+                has_dominant = 'Spl' in alleles or any('Spl' in a for a in alleles)
+            elif gene_name == 'leopard':
+                has_dominant = 'Lp' in alleles
+            elif gene_name == 'champagne':
+                has_dominant = 'Ch' in alleles
+
+            if has_dominant:
+                horses_with_pattern += 1
+
+        pattern_prevalence[gene_name] = horses_with_pattern * pct_per_horse
+
+    # Create bar chart
+    if pattern_prevalence:
+        gene_viz_mode = st.radio(
+            "Pattern Gene View",
+            ["Chart", "List"],
+            key="gene_viz_mode",
+            horizontal=True
+        )
+
+        if gene_viz_mode == "Chart":
+            fig, ax = plt.subplots(figsize=(12, 6))
+
+            genes = list(pattern_prevalence)
+            percentages = list(pattern_prevalence.values())
+
+            # Create color mapping based on percentage
+            colors = []
+            for pct in percentages:
+                if pct >= 25:
+                    colors.append('#2E7D32')  # Dark green - common
+                elif pct >= 10:
+                    colors.append('#1976D2')  # Blue - moderate
+                elif pct >= 5:
+                    colors.append('#F57C00')  # Orange - uncommon
+                else:
+                    colors.append('#C62828')  # Red - rare
+
+            bars = ax.bar(genes, percentages, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+
+            # Add value labels on bars
+            for bar, pct in zip(bars, percentages):
+                height = bar.get_height()
+                ax.text(bar.get_x() + bar.get_width()/2., height,
+                       f'{pct:.1f}%',
+                       ha='center', va='bottom', fontsize=10, weight='bold')
+
+            ax.set_ylabel('Prevalence (%)', fontsize=12, weight='bold')
+            ax.set_xlabel('Pattern Gene', fontsize=12, weight='bold')
+            ax.set_title('Pattern Gene Prevalence in Population', fontsize=14, weight='bold', pad=20)
+            ax.set_ylim(0, max(percentages) * 1.15 if percentages else 100)
+            ax.grid(axis='y', alpha=0.3, linestyle='--')
+
+            # Rotate x-axis labels
+            plt.xticks(rotation=45, ha='right')
+
+            # Add legend
+            from matplotlib.patches import Patch
+            legend_elements = [
+                Patch(facecolor='#2E7D32', label='Common (≥25%)'),
+                Patch(facecolor='#1976D2', label='Moderate (10-25%)'),
+                Patch(facecolor='#F57C00', label='Uncommon (5-10%)'),
+                Patch(facecolor='#C62828', label='Rare (<5%)')
+            ]
+            ax.legend(handles=legend_elements, loc='upper right')
+
+            plt.tight_layout()
+            st.pyplot(fig)
+            plt.close()
+
+            # Show realistic comparison
+            st.caption("💡 **Realistic frequencies:** Gray ~30%, Sabino ~26%, Tobiano ~24%, Leopard ~8%, Roan ~7%")
+        else:
+            # List view as one markdown table
+            rows = "\n".join(
+                f"| **{gene_name.replace('_', ' ').title()}** | {'█' * int(pct / 2)} {pct:.1f}% |"
+                for gene_name, pct in pattern_prevalence.items()
+            )
+            st.markdown(f"| Gene | Prevalence |\n|---|---|\n{rows}")
+
+    st.markdown("---")
+
+    # Individual gene frequency details (in expanders)
+    st.markdown("#### 🔬 Detailed Allele Frequencies")
+
+    # Display gene frequency for each gene
+    for gene_name in all_genes:
+        with st.expander(f"📊 {gene_name.replace('_', ' ').title()} - Allele Distribution"):
+            # Already sorted by most_common()
+            _, sorted_alleles = _sorted_freqs(tuple(gene_alleles[gene_name].most_common()))
+
+            # Create horizontal bar chart for alleles
+            if len(sorted_alleles) > 1:
+                st.altair_chart(
+                    horizontal_bar_chart(
+                        [a for a, _, _ in sorted_alleles],
+                        [f * 100 for _, _, f in sorted_alleles],
+                        [f"{f * 100:.1f}% ({c})" for _, c, f in sorted_alleles],
+                        value_title='Frequency (%)'
+                    ),
+                    use_container_width=True
+                )
+            else:
+                # Just show a one-element table if only one allele
+                st.dataframe(
+                    {
+                        "Allele": [a for a, _, _ in sorted_alleles],
+                        "Count": [c for _, c, _ in sorted_alleles],
+                        "Frequency": [f * 100 for _, _, f in sorted_alleles],
+                    },
+                    column_config={
+                        "Frequency": st.column_config.ProgressColumn(
+                            min_value=0, max_value=100, format="%.1f%%"
+                        )
+                    },
+                    hide_index=True,
+                    use_container_width=True
+                )
+
+@st.fragment
+def render_diversity_score(n_phenotypes, allele_lens, total_horses, lang='en'):
+    """
+    Render the overall stable diversity score.
+
+    Args:
+        n_phenotypes: Number of distinct phenotypes
+        allele_lens: Tuple with the number of distinct alleles for each gene
+        total_horses: Number of horses in the stable
+        lang: Language code
+    """
+    # Diversity score
+    st.markdown(f"### 🌈 {t('statistics.diversity_title', lang)}")
+
+    # Based on phenotype variety and allele distribution (cached across reruns)
+    diversity_score = _diversity_score(n_phenotypes, total_horses, allele_lens)
+
+    col_div1, col_div2 = st.columns(_COL_1_2)
+
+    with col_div1:
+        st.metric(f"🌟 {t('statistics.diversity_score', lang)}", f"{diversity_score}%")
+
+    with col_div2:
+        if diversity_score >= 70:
+            st.success(f"✅ {t('statistics.diversity_high', lang)}")
+        elif diversity_score >= 40:
+            st.info(f"📊 {t('statistics.diversity_medium', lang)}")
+        else:
+            st.warning(f"⚠️ {t('statistics.diversity_low', lang)}")
+
+@functools.lru_cache(maxsize=8)
+def _about_markdown(lang='en'):
+    """
+    Build the About tab markdown bodies once per language.
+
+    Args:
+        lang: Language code
+
+    Returns:
+        dict: {'genetics', 'colors', 'tech_stack', 'performance'} -> markdown string
+    """
+    a = _section_strings('about', lang)
+    genes = "\n".join(f"{i}. {a[f'genetics_{i}']}" for i in range(1, 15))
+
+    return {
+        'genetics': (
+            f"### 🔬 {a['genetics_title']}\n\n{a['genetics_description']}\n\n{genes}\n\n"
+            f"### 🧮 {a['mendelian']}\n\n{a['mendelian_description']}"
+        ),
+        'colors': (
+            f"### 🎨 {a['colors_title']}\n\n{a['colors_base']}\n\n{a['colors_cream']}\n\n"
+            f"{a['colors_pearl']}\n\n{a['colors_special']}"
+        ),
+        'tech_stack': (
+            f"### 💻 {a['tech_stack']}\n\n- {a['tech_backend']}\n- {a['tech_web']}\n"
+            f"- {a['tech_api']}\n- {a['tech_license']}"
+        ),
+        'performance': (
+            f"### 📊 {a['performance_title']}\n\n- {a['performance_generation']}\n"
+            f"- {a['performance_breeding']}\n- {a['performance_tests']}\n- {a['performance_memory']}"
+        ),
+    }
+
+@functools.lru_cache(maxsize=8)
+def _about_metrics(lang='en'):
+    """Return the About page (label, value) metric pairs for a language."""
+    a = _section_strings('about', lang)
+    return (
+        (a['total_genes'], "14"),
+        (a['phenotypes'], "100+"),
+        (a['tests'], "142/142 ✅"),
+    )
+
+@functools.lru_cache(maxsize=16)
+def _footer_html(lang='en'):
+    """Build the page footer HTML once per language."""
+    footer = _section_strings('footer', lang)
+    return f"""
+<div style="text-align: center; color: #6c757d;">
+    <p>🐴 {footer['made_with']}</p>
+    <p><a href="https://github.com/Metroseksuaali/Horsegenetics" target="_blank">{footer['github']}</a></p>
+</div>
+"""
+
+@st.fragment
+def render_about_tabs(lang='en'):
+    """
+    Render the About page tabs.
+
+    Args:
+        lang: Language code
+    """
+    a = _section_strings('about', lang)
+    md = _about_markdown(lang)
+
+    tab1, tab2, tab3 = st.tabs([a['tab_genetics'], a['tab_colors'], a['tab_tech']])
+
+    with tab1:
+        st.markdown(md['genetics'])
+
+    with tab2:
+        st.markdown(md['colors'])
+
+    with tab3:
+        col_tech1, col_tech2 = st.columns(2)
+
+        with col_tech1:
+            st.markdown(md['tech_stack'])
+
+        with col_tech2:
+            st.markdown(md['performance'])
 
 # Page configuration
 st.set_page_config(
@@ -540,63 +1279,25 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-    }
-    .subtitle {
-        color: #6c757d;
-        font-size: 1.2rem;
-        margin-bottom: 2rem;
-    }
-    .horse-card {
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    .stat-box {
-        padding: 1rem;
-        border-radius: 8px;
-        background: #f8f9fa;
-        border-left: 4px solid #667eea;
-    }
-    .success-box {
-        padding: 1rem;
-        border-radius: 8px;
-        background: #d4edda;
-        border-left: 4px solid #28a745;
-        color: #155724;
-    }
-    .pedigree-box {
-        padding: 1rem;
-        border-radius: 8px;
-        background: #f8f9fa;
-        border: 2px solid #667eea;
-        margin: 0.5rem 0;
-    }
-    .ancestor-box {
-        padding: 0.8rem;
-        border-radius: 6px;
-        background: #e9ecef;
-        margin: 0.3rem 0;
-        border-left: 3px solid #6c757d;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for better styling. Streamlit drops elements a rerun does not
+# emit again, so the style block is sent every run; keeping it a constant
+# avoids rebuilding the string.
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Initialize session state
-if 'horses' not in st.session_state:
-    st.session_state.horses = []
+if 'stable' not in st.session_state:
+    st.session_state.stable = new_stable()
+if 'stable_version' not in st.session_state:
+    st.session_state.stable_version = 0
 if 'pedigree' not in st.session_state:
     st.session_state.pedigree = PedigreeTree()
+if 'pedigree_version' not in st.session_state:
+    st.session_state.pedigree_version = 0
+# Horse counts, refreshed by mark_stable_changed() / mark_pedigree_changed()
+if 'n_horses' not in st.session_state:
+    st.session_state.n_horses = 0
+if 'n_pedigree' not in st.session_state:
+    st.session_state.n_pedigree = 0
 if 'history' not in st.session_state:
     st.session_state.history = []
 if 'lang' not in st.session_state:
@@ -616,18 +1317,19 @@ with st.sidebar:
         trans = load_translations(lang_code)
         return f"{trans['language_flag']} {trans['language_name']}"
 
-    selected_lang = st.selectbox(
+    def _set_language():
+        st.session_state.lang = st.session_state.language_selector
+
+    # The callback switches the language before the rerun, so no second run is needed
+    st.selectbox(
         t('sidebar.language', lang),
         options=["en", "fi"],
         index=["en", "fi"].index(st.session_state.lang),
         format_func=format_language,
-        key="language_selector"
+        key="language_selector",
+        on_change=_set_language
     )
 
-    if selected_lang != st.session_state.lang:
-        st.session_state.lang = selected_lang
-        st.rerun()
-
     st.markdown("---")
 
     page = st.radio(
@@ -641,20 +1343,21 @@ with st.sidebar:
     st.markdown("---")
 
     # Quick stats
-    if st.session_state.horses:
+    if st.session_state.n_horses:
         st.markdown(f"### 📊 {t('sidebar.quick_stats', lang)}")
-        st.metric(t('sidebar.total_horses', lang), len(st.session_state.horses))
-        st.metric(t('sidebar.in_pedigree', lang), len(st.session_state.pedigree.horses))
+        st.metric(t('sidebar.total_horses', lang), st.session_state.n_horses)
+        st.metric(t('sidebar.in_pedigree', lang), st.session_state.n_pedigree)
 
     st.markdown("---")
-    st.caption(f"🔬 {t('sidebar.scientifically_accurate', lang)}")
-    st.caption(f"⚡ {t('sidebar.performance', lang)}")
-    st.caption("[💻 GitHub](https://github.com/Metroseksuaali/Horsegenetics)")
+    st.caption(
+        f"🔬 {t('sidebar.scientifically_accurate', lang)}  \n"
+        f"⚡ {t('sidebar.performance', lang)}  \n"
+        "[💻 GitHub](https://github.com/Metroseksuaali/Horsegenetics)"
+    )
 
 # Main content
 if page == t('nav.generator', lang):
-    st.markdown(f'<p class="main-header">🎲 {t("generator.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("generator.subtitle", lang)}</p>', unsafe_allow_html=True)
+    page_header('🎲', t('generator.title', lang), t('generator.subtitle', lang))
 
     # Help/Instructions
     with st.expander(f"ℹ️ {t('generator.how_to_use', lang)}", expanded=False):
@@ -662,56 +1365,56 @@ if page == t('nav.generator', lang):
 
     st.markdown("---")
 
-    # Controls in a nice box
-    with st.container():
-        col1, col2 = st.columns([2, 2])
+    # Breed Presets (outside the form so the description preview follows the selection)
+    with st.expander("🏇 Breed Presets - Quick configurations", expanded=False):
+        from genetics.breed_presets import get_preset_manager
 
-        with col1:
-            num_horses = st.slider(f"🔢 {t('generator.how_many', lang)}", 1, 10, 1)
+        preset_manager = get_preset_manager()
 
-        with col2:
-            auto_name = st.checkbox(t('generator.auto_generate_names', lang), value=True)
-
-        # Breed Presets
-        with st.expander("🏇 Breed Presets - Quick configurations", expanded=False):
-            from genetics.breed_presets import get_preset_manager
+        st.markdown("**Realistic Breeds**")
+        realistic_breeds = preset_manager.get_realistic_breeds()
+        realistic_options = ["None (Custom)"] + [p.name for p in realistic_breeds.values()]
+        realistic_choice = st.selectbox(
+            "Select a realistic breed",
+            realistic_options,
+            key="realistic_breed"
+        )
 
-            preset_manager = get_preset_manager()
+        st.markdown("**Fantasy Breeds**")
+        fantasy_breeds = preset_manager.get_fantasy_breeds()
+        fantasy_options = ["None (Custom)"] + [p.name for p in fantasy_breeds.values()]
+        fantasy_choice = st.selectbox(
+            "Select a fantasy breed",
+            fantasy_options,
+            key="fantasy_breed"
+        )
 
-            st.markdown("**Realistic Breeds**")
-            realistic_breeds = preset_manager.get_realistic_breeds()
-            realistic_options = ["None (Custom)"] + [p.name for p in realistic_breeds.values()]
-            realistic_choice = st.selectbox(
-                "Select a realistic breed",
-                realistic_options,
-                key="realistic_breed"
-            )
+        # Get selected preset
+        selected_preset = None
+        if realistic_choice != "None (Custom)":
+            for key, preset in realistic_breeds.items():
+                if preset.name == realistic_choice:
+                    selected_preset = preset
+                    break
+        elif fantasy_choice != "None (Custom)":
+            for key, preset in fantasy_breeds.items():
+                if preset.name == fantasy_choice:
+                    selected_preset = preset
+                    break
+
+        if selected_preset:
+            st.info(f"📝 {selected_preset.description}")
+            st.caption("This preset will override gene controls below")
+
+    # Controls live in a form so slider/checkbox changes don't rerun the app until submit
+    with st.form("gen_form", border=False):
+        col1, col2 = st.columns(2)
 
-            st.markdown("**Fantasy Breeds**")
-            fantasy_breeds = preset_manager.get_fantasy_breeds()
-            fantasy_options = ["None (Custom)"] + [p.name for p in fantasy_breeds.values()]
-            fantasy_choice = st.selectbox(
-                "Select a fantasy breed",
-                fantasy_options,
-                key="fantasy_breed"
-            )
+        with col1:
+            num_horses = st.slider(f"🔢 {t('generator.how_many', lang)}", 1, 10, 1)
 
-            # Get selected preset
-            selected_preset = None
-            if realistic_choice != "None (Custom)":
-                for key, preset in realistic_breeds.items():
-                    if preset.name == realistic_choice:
-                        selected_preset = preset
-                        break
-            elif fantasy_choice != "None (Custom)":
-                for key, preset in fantasy_breeds.items():
-                    if preset.name == fantasy_choice:
-                        selected_preset = preset
-                        break
-
-            if selected_preset:
-                st.info(f"📝 {selected_preset.description}")
-                st.caption("This preset will override gene controls below")
+        with col2:
+            auto_name = st.checkbox(t('generator.auto_generate_names', lang), value=True)
 
         # Advanced generation options
         with st.expander("⚙️ Advanced Options (Gene Control)", expanded=False):
@@ -800,37 +1503,32 @@ if page == t('nav.generator', lang):
             if splash_prob != 0.975:
                 custom_probs['splash'] = splash_prob
 
-        if st.button(t('generator.generate_button', lang), type="primary", use_container_width=True):
+        if st.form_submit_button(t('generator.generate_button', lang), type="primary", use_container_width=True):
             with st.spinner(f"🔮 {t('generator.generating', lang)}"):
                 # Use preset values if a preset is selected, otherwise use manual values
-                final_excluded_genes = excluded_genes
-                final_custom_probs = custom_probs
-
                 if selected_preset:
                     # Preset overrides manual settings
-                    final_excluded_genes = selected_preset.excluded_genes
-                    final_custom_probs = selected_preset.custom_probabilities
+                    random_kwargs = selected_preset.random_kwargs
                     st.info(f"🏇 Generating {selected_preset.name} horses...")
+                else:
+                    random_kwargs = {
+                        'excluded_genes': excluded_genes or None,
+                        'custom_probabilities': custom_probs or None,
+                    }
 
-                generated = []
-                for i in range(num_horses):
-                    horse = Horse.random(
-                        excluded_genes=final_excluded_genes if final_excluded_genes else None,
-                        custom_probabilities=final_custom_probs if final_custom_probs else None
-                    )
-                    generated.append(horse)
+                registry, calculator = _registry_and_calculator()
+                generated = Horse.random_batch(num_horses, registry, calculator, **random_kwargs)
 
-                    # Generate name based on auto_name setting
-                    if auto_name:
-                        horse_name = generate_random_horse_name()
-                    else:
-                        horse_name = f"Horse {len(st.session_state.horses) + 1}"
+                # Generate names based on auto_name setting
+                if auto_name:
+                    names = [generate_random_horse_name() for _ in generated]
+                else:
+                    base = len(st.session_state.stable['horses'])
+                    names = [f"Horse {base + i}" for i in range(1, num_horses + 1)]
 
-                    st.session_state.horses.append({
-                        'horse': horse,
-                        'name': horse_name,
-                        'generated_at': datetime.now().isoformat()
-                    })
+                # One timestamp per batch, added to the stable in a single extend
+                extend_stable(generated, names, [datetime.now().isoformat()] * num_horses)
+                mark_stable_changed()
 
                 st.success(f"🎉 {t('generator.success', lang, count=num_horses)}")
 
@@ -847,29 +1545,33 @@ if page == t('nav.generator', lang):
     st.markdown("---")
 
     # Show recent horses in a beautiful grid
-    if st.session_state.horses:
+    stable = st.session_state.stable
+    if stable['horses']:
         st.markdown(f"### 📋 {t('generator.recent_horses', lang)}")
-        recent = st.session_state.horses[-6:][::-1]
-
-        cols = st.columns(3)
-        for idx, item in enumerate(recent):
-            with cols[idx % 3]:
-                horse = item['horse']
-                name = item['name']
-                gradient, text_color = get_phenotype_color(horse.phenotype)
-
-                st.markdown(f"""
-                <div class="horse-card" style="background: {gradient}; color: {text_color};">
-                    <h3>🐴 {name}</h3>
-                    <p style="font-size: 1.1rem; margin: 0;">{horse.phenotype}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        # Newest first: walk the last six indices backwards instead of copying slices
+        horses, names = stable['horses'], stable['names']
+        n = len(horses)
+
+        # Render all cards as one HTML grid (3 per row) instead of one element per card
+        cards = []
+        for i in range(n - 1, max(n - 7, -1), -1):
+            horse = horses[i]
+            gradient, text_color = get_phenotype_color(horse.phenotype)
+            cards.append(
+                f'<div class="horse-card" style="background: {gradient}; color: {text_color};">'
+                f'<h3>🐴 {names[i]}</h3>'
+                f'<p style="font-size: 1.1rem; margin: 0;">{horse.phenotype}</p>'
+                f'</div>'
+            )
+        st.markdown(
+            f'<div class="card-grid" style="grid-template-columns: repeat(3, 1fr);">{"".join(cards)}</div>',
+            unsafe_allow_html=True
+        )
     else:
         st.info(f"👋 {t('generator.welcome', lang)}")
 
 elif page == t('nav.breeding', lang):
-    st.markdown(f'<p class="main-header">🧬 {t("breeding.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("breeding.subtitle", lang)}</p>', unsafe_allow_html=True)
+    page_header('🧬', t('breeding.title', lang), t('breeding.subtitle', lang))
 
     # Help/Instructions
     with st.expander(f"ℹ️ {t('breeding.how_to_use', lang)}", expanded=False):
@@ -877,13 +1579,13 @@ elif page == t('nav.breeding', lang):
 
     st.markdown("---")
 
-    if len(st.session_state.horses) < 2:
+    if len(st.session_state.stable['horses']) < 2:
         st.warning(f"⚠️ {t('breeding.need_horses', lang)}")
         if st.button(f"🎲 {t('breeding.go_to_generator', lang)}"):
             st.rerun()
     else:
-        horse_names = [f"{item['name']} - {item['horse'].phenotype}"
-                       for item in st.session_state.horses]
+        stable = st.session_state.stable
+        horse_names = get_horse_labels()
 
         col1, col2 = st.columns(2)
 
@@ -892,7 +1594,7 @@ elif page == t('nav.breeding', lang):
             parent1_idx = st.selectbox(t('breeding.choose_sire', lang), range(len(horse_names)),
                                        format_func=lambda x: horse_names[x], key="p1",
                                        label_visibility="collapsed")
-            parent1 = st.session_state.horses[parent1_idx]['horse']
+            parent1 = stable['horses'][parent1_idx]
 
             with st.expander(f"🔬 {t('breeding.view_genotype', lang)}"):
                 st.code(parent1.genotype_string, language="text")
@@ -902,7 +1604,7 @@ elif page == t('nav.breeding', lang):
             parent2_idx = st.selectbox(t('breeding.choose_dam', lang), range(len(horse_names)),
                                        format_func=lambda x: horse_names[x], key="p2",
                                        label_visibility="collapsed")
-            parent2 = st.session_state.horses[parent2_idx]['horse']
+            parent2 = stable['horses'][parent2_idx]
 
             with st.expander(f"🔬 {t('breeding.view_genotype', lang)}"):
                 st.code(parent2.genotype_string, language="text")
@@ -920,7 +1622,7 @@ elif page == t('nav.breeding', lang):
 
         # Foal naming section
         st.markdown(f"### 🏷️ {t('generator.naming_title', lang)}")
-        col_name1, col_name2 = st.columns([3, 1])
+        col_name1, col_name2 = st.columns(_COL_3_1)
 
         with col_name1:
             foal_name = st.text_input(
@@ -931,9 +1633,8 @@ elif page == t('nav.breeding', lang):
             )
 
         with col_name2:
-            if st.button(t('generator.random_name', lang), use_container_width=True):
-                st.session_state.suggested_foal_name = generate_random_horse_name()
-                st.rerun()
+            st.button(t('generator.random_name', lang), use_container_width=True,
+                      on_click=_suggest_foal_name)
 
         # Use suggested name if available
         if 'suggested_foal_name' in st.session_state and not foal_name:
@@ -942,176 +1643,176 @@ elif page == t('nav.breeding', lang):
 
         st.markdown("<br>", unsafe_allow_html=True)
 
-        # Optional: Influence offspring genetics (advanced)
-        with st.expander("🧬 Advanced: Influence Offspring Genetics", expanded=False):
-            st.caption("Note: These controls simulate selective breeding outcomes. In real genetics, you cannot control which alleles are inherited.")
-
-            st.markdown("**Force specific traits** (overrides natural inheritance)")
-            influence_col1, influence_col2 = st.columns(2)
-
-            with influence_col1:
-                force_no_gray = st.checkbox("Force no Gray", value=False, key="breed_no_gray")
-                force_no_leopard = st.checkbox("Force no Leopard", value=False, key="breed_no_leopard")
-                force_no_kit = st.checkbox("Force no KIT Patterns", value=False, key="breed_no_kit",
-                                          help="Excludes Roan, Tobiano, Sabino, Dominant White")
-
-            with influence_col2:
-                force_no_frame = st.checkbox("Force no Frame", value=False, key="breed_no_frame")
-                force_no_splash = st.checkbox("Force no Splash", value=False, key="breed_no_splash")
-
-            # Build forced exclusions
-            forced_exclusions = set()
-            if force_no_gray:
-                forced_exclusions.add('gray')
-            if force_no_leopard:
-                forced_exclusions.add('leopard')
-            if force_no_kit:
-                forced_exclusions.add('kit')
-            if force_no_frame:
-                forced_exclusions.add('frame')
-            if force_no_splash:
-                forced_exclusions.add('splash')
-
-            if forced_exclusions:
-                st.warning(f"⚠️ Forcing exclusion of: {', '.join(forced_exclusions)}")
+        # Exclusions and the breed button form one submit, so toggling options doesn't rerun
+        with st.form("breed_form", border=False):
+            # Optional: Influence offspring genetics (advanced)
+            with st.expander("🧬 Advanced: Influence Offspring Genetics", expanded=False):
+                st.caption("Note: These controls simulate selective breeding outcomes. In real genetics, you cannot control which alleles are inherited.")
+
+                st.markdown("**Force specific traits** (overrides natural inheritance)")
                 st.caption("This simulates selective breeding where only foals without these traits are kept.")
+                influence_col1, influence_col2 = st.columns(2)
+
+                with influence_col1:
+                    force_no_gray = st.checkbox("Force no Gray", value=False, key="breed_no_gray")
+                    force_no_leopard = st.checkbox("Force no Leopard", value=False, key="breed_no_leopard")
+                    force_no_kit = st.checkbox("Force no KIT Patterns", value=False, key="breed_no_kit",
+                                              help="Excludes Roan, Tobiano, Sabino, Dominant White")
+
+                with influence_col2:
+                    force_no_frame = st.checkbox("Force no Frame", value=False, key="breed_no_frame")
+                    force_no_splash = st.checkbox("Force no Splash", value=False, key="breed_no_splash")
+
+                # Build forced exclusions
+                forced_exclusions = set()
+                if force_no_gray:
+                    forced_exclusions.add('gray')
+                if force_no_leopard:
+                    forced_exclusions.add('leopard')
+                if force_no_kit:
+                    forced_exclusions.add('kit')
+                if force_no_frame:
+                    forced_exclusions.add('frame')
+                if force_no_splash:
+                    forced_exclusions.add('splash')
 
-        st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown("<br>", unsafe_allow_html=True)
 
-        # Center the breed button
-        col_a, col_b, col_c = st.columns([1, 2, 1])
-        with col_b:
-            if st.button(t('breeding.breed_button', lang), type="primary", use_container_width=True):
-                with st.spinner(f"🔬 {t('breeding.breeding', lang)}"):
-                    # If forced exclusions, try breeding multiple times until we get a matching foal
-                    # This simulates selective breeding where only foals with desired traits are kept
-                    max_attempts = 50
-                    offspring = None
-
-                    if forced_exclusions:
-                        for attempt in range(max_attempts):
-                            candidate = Horse.breed(parent1, parent2)
-
-                            # Check if candidate has any forced exclusions
-                            has_excluded = False
-                            for gene in forced_exclusions:
-                                alleles = candidate.genotype.get(gene, ('n', 'n'))
-                                if any(allele != 'n' for allele in alleles):
-                                    has_excluded = True
+            # Center the breed button
+            col_a, col_b, col_c = st.columns(_COL_1_2_1)
+            with col_b:
+                if st.form_submit_button(t('breeding.breed_button', lang), type="primary", use_container_width=True):
+                    with st.spinner(f"🔬 {t('breeding.breeding', lang)}"):
+                        # If forced exclusions, try breeding multiple times until we get a matching foal
+                        # This simulates selective breeding where only foals with desired traits are kept
+                        max_attempts = 50
+                        offspring = None
+                        registry, calculator = _registry_and_calculator()
+
+                        if forced_exclusions:
+                            # Checkbox values only reach the script on submit, so report them here
+                            st.warning(f"⚠️ Forcing exclusion of: {', '.join(sorted(forced_exclusions))}")
+
+                            # Breed all candidate genotypes in one batch and build a Horse
+                            # only for the foal that is kept
+                            candidates = registry.breed_batch(parent1.genotype, parent2.genotype, max_attempts)
+                            for candidate_genotype in candidates:
+                                # Check if candidate has any forced exclusions
+                                has_excluded = any(
+                                    allele != 'n'
+                                    for gene in forced_exclusions
+                                    for allele in candidate_genotype.get(gene, ('n', 'n'))
+                                )
+
+                                if not has_excluded:
+                                    offspring = Horse(candidate_genotype, registry, calculator, allow_lethal=True)
                                     break
 
-                            if not has_excluded:
-                                offspring = candidate
-                                break
+                            if offspring is None:
+                                st.error(f"❌ Could not produce a foal without the excluded traits after {max_attempts} attempts. Try different parents or relax constraints.")
+                                offspring = Horse(candidates[-1], registry, calculator, allow_lethal=True)  # Show last attempt anyway
+                        else:
+                            offspring = Horse.breed(parent1, parent2, registry, calculator)
 
-                        if offspring is None:
-                            st.error(f"❌ Could not produce a foal without the excluded traits after {max_attempts} attempts. Try different parents or relax constraints.")
-                            offspring = Horse.breed(parent1, parent2)  # Show last attempt anyway
-                    else:
-                        offspring = Horse.breed(parent1, parent2)
+                        # Check if offspring is NONVIABLE
+                        is_nonviable = 'NONVIABLE' in offspring.phenotype
 
-                    # Check if offspring is NONVIABLE
-                    is_nonviable = 'NONVIABLE' in offspring.phenotype
+                        if is_nonviable:
+                            # Show sad message for lethal foal
+                            st.error("💔 **Breeding Resulted in Non-Viable Foal**")
 
-                    if is_nonviable:
-                        # Show sad message for lethal foal
-                        st.error("💔 **Breeding Resulted in Non-Viable Foal**")
+                            st.markdown("### ⚠️ What Happened?")
+                            col_res1, col_res2, col_res3 = st.columns(3)
 
-                        st.markdown("### ⚠️ What Happened?")
-                        col_res1, col_res2, col_res3 = st.columns(3)
+                            with col_res1:
+                                st.markdown(f"**👨 {t('breeding.sire', lang)}**")
+                                st.info(parent1.phenotype)
 
-                        with col_res1:
-                            st.markdown(f"**👨 {t('breeding.sire', lang)}**")
-                            st.info(parent1.phenotype)
+                            with col_res2:
+                                st.markdown(f"**❌ {t('breeding.offspring', lang)}**")
+                                st.error(f"**{offspring.phenotype}**")
 
-                        with col_res2:
-                            st.markdown(f"**❌ {t('breeding.offspring', lang)}**")
-                            st.error(f"**{offspring.phenotype}**")
+                            with col_res3:
+                                st.markdown(f"**👩 {t('breeding.dam', lang)}**")
+                                st.info(parent2.phenotype)
 
-                        with col_res3:
-                            st.markdown(f"**👩 {t('breeding.dam', lang)}**")
-                            st.info(parent2.phenotype)
+                            st.markdown("<br>", unsafe_allow_html=True)
 
-                        st.markdown("<br>", unsafe_allow_html=True)
+                            # Explain the genetics
+                            st.warning("""
+                            **🧬 Genetic Explanation:**
 
-                        # Explain the genetics
-                        st.warning("""
-                        **🧬 Genetic Explanation:**
+                            This foal inherited a lethal gene combination from both parents. In real horse breeding:
+                            - **LWOS (Lethal White Overo Syndrome)**: O/O foals are born all white but lack nerve cells in their intestines. They die within 2-3 days.
+                            - **Dominant White homozygous**: Most W/W combinations (except W20/W20) result in embryonic death.
 
-                        This foal inherited a lethal gene combination from both parents. In real horse breeding:
-                        - **LWOS (Lethal White Overo Syndrome)**: O/O foals are born all white but lack nerve cells in their intestines. They die within 2-3 days.
-                        - **Dominant White homozygous**: Most W/W combinations (except W20/W20) result in embryonic death.
+                            **This foal was NOT added to your stable.**
+                            """)
 
-                        **This foal was NOT added to your stable.**
-                        """)
+                            st.info("""
+                            💡 **Breeding Recommendation:**
 
-                        st.info("""
-                        💡 **Breeding Recommendation:**
+                            To avoid lethal foals:
+                            - ❌ **DON'T breed** Frame Overo (O/n) × Frame Overo (O/n)
+                            - ❌ **DON'T breed** two horses with the same lethal Dominant White allele
+                            - ✅ **DO breed** Frame Overo (O/n) × Solid (n/n) - 100% viable!
+                            - ✅ **DO breed** Dominant White (W/n) × Solid (n/n) - 100% viable!
+                            """)
 
-                        To avoid lethal foals:
-                        - ❌ **DON'T breed** Frame Overo (O/n) × Frame Overo (O/n)
-                        - ❌ **DON'T breed** two horses with the same lethal Dominant White allele
-                        - ✅ **DO breed** Frame Overo (O/n) × Solid (n/n) - 100% viable!
-                        - ✅ **DO breed** Dominant White (W/n) × Solid (n/n) - 100% viable!
-                        """)
+                            with st.expander(f"🧬 {t('breeding.offspring_genotype', lang)}", expanded=False):
+                                st.code(offspring.genotype_string, language="text")
 
-                        with st.expander(f"🧬 {t('breeding.offspring_genotype', lang)}", expanded=False):
-                            st.code(offspring.genotype_string, language="text")
+                        else:
+                            # Healthy foal - add to stable
+                            # Use provided name or generate default
+                            if not foal_name:
+                                foal_name = generate_random_horse_name()
 
-                    else:
-                        # Healthy foal - add to stable
-                        # Use provided name or generate default
-                        if not foal_name:
-                            foal_name = generate_random_horse_name()
-
-                        st.session_state.horses.append({
-                            'horse': offspring,
-                            'name': foal_name,
-                            'generated_at': datetime.now().isoformat(),
-                            'parents': (parent1_idx, parent2_idx)
-                        })
-
-                        # Add to pedigree
-                        st.session_state.pedigree.add_breeding(
-                            parent1, parent2, offspring,
-                            sire_name=st.session_state.horses[parent1_idx]['name'],
-                            dam_name=st.session_state.horses[parent2_idx]['name'],
-                            foal_name=foal_name
-                        )
+                            add_to_stable(offspring, foal_name, datetime.now().isoformat(),
+                                          parents=(parent1_idx, parent2_idx))
+                            mark_stable_changed()
+
+                            # Add to pedigree
+                            st.session_state.pedigree.add_breeding(
+                                parent1, parent2, offspring,
+                                sire_name=stable['names'][parent1_idx],
+                                dam_name=stable['names'][parent2_idx],
+                                foal_name=foal_name
+                            )
+                            mark_pedigree_changed()
 
-                        # Clear suggested name after breeding
-                        if 'suggested_foal_name' in st.session_state:
-                            del st.session_state.suggested_foal_name
+                            # Clear suggested name after breeding
+                            if 'suggested_foal_name' in st.session_state:
+                                del st.session_state.suggested_foal_name
 
-                        st.success(f"🎊 {t('breeding.congratulations', lang)}")
+                            st.success(f"🎊 {t('breeding.congratulations', lang)}")
 
-                        # Display offspring beautifully
-                        st.markdown(f"### 🐴 {t('breeding.meet_foal', lang)}")
+                            # Display offspring beautifully
+                            st.markdown(f"### 🐴 {t('breeding.meet_foal', lang)}")
 
-                        col_res1, col_res2, col_res3 = st.columns(3)
+                            col_res1, col_res2, col_res3 = st.columns(3)
 
-                        with col_res1:
-                            st.markdown(f"**👨 {t('breeding.sire', lang)}**")
-                            st.info(parent1.phenotype)
+                            with col_res1:
+                                st.markdown(f"**👨 {t('breeding.sire', lang)}**")
+                                st.info(parent1.phenotype)
 
-                        with col_res2:
-                            st.markdown(f"**🐴 {t('breeding.offspring', lang)}**")
-                            st.success(f"**{offspring.phenotype}**")
+                            with col_res2:
+                                st.markdown(f"**🐴 {t('breeding.offspring', lang)}**")
+                                st.success(f"**{offspring.phenotype}**")
 
-                        with col_res3:
-                            st.markdown(f"**👩 {t('breeding.dam', lang)}**")
-                            st.info(parent2.phenotype)
+                            with col_res3:
+                                st.markdown(f"**👩 {t('breeding.dam', lang)}**")
+                                st.info(parent2.phenotype)
 
-                        st.markdown("<br>", unsafe_allow_html=True)
+                            st.markdown("<br>", unsafe_allow_html=True)
 
-                        # Show foal genotype
-                        st.markdown(f"### 🎨 {foal_name}")
-                        with st.expander(f"🧬 {t('breeding.offspring_genotype', lang)}", expanded=True):
-                            st.code(offspring.genotype_string, language="text")
+                            # Show foal genotype
+                            st.markdown(f"### 🎨 {foal_name}")
+                            with st.expander(f"🧬 {t('breeding.offspring_genotype', lang)}", expanded=True):
+                                st.code(offspring.genotype_string, language="text")
 
 elif page == t('nav.probability', lang):
-    st.markdown(f'<p class="main-header">📊 {t("probability.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("probability.subtitle", lang)}</p>', unsafe_allow_html=True)
+    page_header('📊', t('probability.title', lang), t('probability.subtitle', lang))
 
     # Help/Instructions
     with st.expander(f"ℹ️ {t('probability.how_to_use', lang)}", expanded=False):
@@ -1119,63 +1820,75 @@ elif page == t('nav.probability', lang):
 
     st.markdown("---")
 
-    if len(st.session_state.horses) < 2:
+    if len(st.session_state.stable['horses']) < 2:
         st.warning(f"⚠️ {t('probability.need_horses', lang)}")
     else:
-        horse_names = [f"{item['name']} - {item['horse'].phenotype}"
-                       for item in st.session_state.horses]
+        stable = st.session_state.stable
+        horse_names = get_horse_labels()
 
         col1, col2 = st.columns(2)
 
         with col1:
             parent1_idx = st.selectbox(f"👨 {t('probability.select_parent1', lang)}", range(len(horse_names)),
                                       format_func=lambda x: horse_names[x])
-            parent1 = st.session_state.horses[parent1_idx]['horse']
+            parent1 = stable['horses'][parent1_idx]
 
         with col2:
             parent2_idx = st.selectbox(f"👩 {t('probability.select_parent2', lang)}", range(len(horse_names)),
                                       format_func=lambda x: horse_names[x])
-            parent2 = st.session_state.horses[parent2_idx]['horse']
+            parent2 = stable['horses'][parent2_idx]
 
         st.markdown("<br>", unsafe_allow_html=True)
 
+        parent_pair = (parent1.genotype_string, parent2.genotype_string)
+
         if st.button(t('probability.calculate_button', lang), type="primary", use_container_width=True):
             with st.spinner(f"🧮 {t('probability.calculating', lang)}"):
-                probs = calculate_offspring_probabilities(
-                    parent1.genotype_string,
-                    parent2.genotype_string
-                )
-
-                st.success(f"✅ {t('probability.complete', lang)}")
+                _offspring_probabilities(*parent_pair)
+            st.session_state.probability_pair = parent_pair
 
-                st.markdown(f"### 📈 {t('probability.distribution', lang)}")
+        # Keep showing the last result across reruns while the same parents stay
+        # selected; it is served from the _offspring_probabilities cache
+        if st.session_state.get('probability_pair') == parent_pair:
+            probs = _offspring_probabilities(*parent_pair)
 
-                # Show top results
-                top_results = list(probs.items())[:10]
+            st.success(f"✅ {t('probability.complete', lang)}")
 
-                for phenotype, prob in top_results:
-                    col_name, col_bar = st.columns([1, 3])
+            st.markdown(f"### 📈 {t('probability.distribution', lang)}")
 
-                    with col_name:
-                        st.markdown(f"**{phenotype}**")
+            # Show top results
+            top_results = list(islice(probs.items(), 10))
 
-                    with col_bar:
-                        st.progress(prob, text=f"{prob*100:.1f}%")
+            st.altair_chart(
+                horizontal_bar_chart(
+                    [phenotype for phenotype, _ in top_results],
+                    [prob * 100 for _, prob in top_results],
+                    [f"{prob*100:.1f}%" for _, prob in top_results],
+                    value_title='%'
+                ),
+                use_container_width=True
+            )
 
-                st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown("<br>", unsafe_allow_html=True)
 
-                # Detailed table
-                with st.expander(f"📋 {t('probability.view_all', lang)}"):
-                    import pandas as pd
-                    df = pd.DataFrame({
-                        t('probability.phenotype', lang): list(probs.keys()),
-                        t('probability.probability_label', lang): [f"{v*100:.2f}%" for v in probs.values()]
-                    })
-                    st.dataframe(df, use_container_width=True, hide_index=True)
+            # Detailed table
+            with st.expander(f"📋 {t('probability.view_all', lang)}"):
+                prob_label = t('probability.probability_label', lang)
+                # Plain dict of columns: no DataFrame needed here, and the %
+                # formatting is left to the grid renderer
+                table = {
+                    t('probability.phenotype', lang): list(probs),
+                    prob_label: [prob * 100 for prob in probs.values()]
+                }
+                st.dataframe(
+                    table,
+                    column_config={prob_label: st.column_config.NumberColumn(format="%.2f%%")},
+                    use_container_width=True,
+                    hide_index=True
+                )
 
 elif page == t('nav.stable', lang):
-    st.markdown(f'<p class="main-header">📚 {t("stable.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("stable.subtitle", lang)}</p>', unsafe_allow_html=True)
+    page_header('📚', t('stable.title', lang), t('stable.subtitle', lang))
 
     # Help/Instructions
     with st.expander(f"ℹ️ {t('stable.how_to_use', lang)}", expanded=False):
@@ -1183,18 +1896,18 @@ elif page == t('nav.stable', lang):
 
     st.markdown("---")
 
+    stable_indexes = get_stable_indexes()
+
     # Stats
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric(f"🐴 {t('stable.total_horses', lang)}", len(st.session_state.horses))
+        st.metric(f"🐴 {t('stable.total_horses', lang)}", st.session_state.n_horses)
     with col2:
-        bred = sum(1 for h in st.session_state.horses if 'parents' in h)
-        st.metric(f"🧬 {t('stable.bred_horses', lang)}", bred)
+        st.metric(f"🧬 {t('stable.bred_horses', lang)}", len(stable_indexes['bred']))
     with col3:
-        foundation = len(st.session_state.horses) - bred
-        st.metric(f"✨ {t('stable.foundation', lang)}", foundation)
+        st.metric(f"✨ {t('stable.foundation', lang)}", len(stable_indexes['foundation']))
     with col4:
-        st.metric(f"🌳 {t('sidebar.in_pedigree', lang)}", len(st.session_state.pedigree.horses))
+        st.metric(f"🌳 {t('sidebar.in_pedigree', lang)}", st.session_state.n_pedigree)
 
     st.markdown("---")
 
@@ -1211,11 +1924,8 @@ elif page == t('nav.stable', lang):
         )
 
     with col_pheno:
-        # Get unique phenotypes from horses
-        phenotypes = set()
-        for item in st.session_state.horses:
-            phenotypes.add(item['horse'].phenotype)
-        phenotype_options = [t('stable.filter_all', lang)] + sorted(list(phenotypes))
+        # Unique phenotypes are the keys of the cached phenotype counts
+        phenotype_options = [t('stable.filter_all', lang)] + sorted(stable_indexes['phenotype_counts'])
 
         selected_phenotype = st.selectbox(
             t('stable.filter_phenotype', lang),
@@ -1235,30 +1945,46 @@ elif page == t('nav.stable', lang):
             key="type_filter"
         )
 
-    # Apply filters
-    filtered_horses = []
-    for idx, item in enumerate(st.session_state.horses):
-        horse = item['horse']
-        name = item['name']
+    # Apply filters (produces stable indices; columns are looked up on display)
+    stable = st.session_state.stable
+    horses = stable['horses']
+    names = stable['names']
+    all_label = t('stable.filter_all', lang)
+
+    # Type filter maps directly onto the precomputed index sets
+    if selected_type == t('stable.filter_foundation', lang):
+        type_indexes = stable_indexes['foundation']
+    elif selected_type == t('stable.filter_bred', lang):
+        type_indexes = stable_indexes['bred']
+    else:
+        type_indexes = None
 
-        # Name filter (case-insensitive)
-        if search_term and search_term.lower() not in name.lower():
-            continue
+    if not search_term and selected_phenotype == all_label:
+        # No per-horse criteria: skip the scan entirely
+        if type_indexes is None:
+            filtered_idx = list(range(len(horses)))
+        else:
+            filtered_idx = sorted(type_indexes)
+    else:
+        search_lower = search_term.lower()
+        filtered_idx = []
+        for idx, (horse, name) in enumerate(zip(horses, names)):
+            # Name filter (case-insensitive)
+            if search_lower and search_lower not in name.lower():
+                continue
 
-        # Phenotype filter
-        if selected_phenotype != t('stable.filter_all', lang) and horse.phenotype != selected_phenotype:
-            continue
+            # Phenotype filter
+            if selected_phenotype != all_label and horse.phenotype != selected_phenotype:
+                continue
 
-        # Type filter
-        if selected_type == t('stable.filter_foundation', lang) and 'parents' in item:
-            continue
-        elif selected_type == t('stable.filter_bred', lang) and 'parents' not in item:
-            continue
+            # Type filter
+            if type_indexes is not None and idx not in type_indexes:
+                continue
 
-        filtered_horses.append((idx, item))
+            filtered_idx.append(idx)
 
     # Show count
-    st.caption(t('stable.showing_count', lang, filtered=len(filtered_horses), total=len(st.session_state.horses)))
+    st.caption(t('stable.showing_count', lang, filtered=len(filtered_idx), total=len(horses)))
 
     st.markdown("---")
 
@@ -1266,23 +1992,33 @@ elif page == t('nav.stable', lang):
     col_act1, col_act2 = st.columns(2)
 
     with col_act1:
-        if st.session_state.horses:
-            horses_data = [item['horse'].to_dict() for item in st.session_state.horses]
-            json_str = json.dumps(horses_data, indent=2)
+        if horses:
+            def _serialize_stable():
+                horses_data = [horse.to_dict() for horse in horses]
+                if orjson:
+                    return orjson.dumps(horses_data)
+                return json.dumps(horses_data, separators=(',', ':')).encode('utf-8')
+
+            # Serialize only when the stable changed; bytes go to the button without re-encoding
+            json_bytes = session_memo('stable_json', st.session_state.stable_version, _serialize_stable)
             st.download_button(
                 t('stable.save_button', lang),
-                json_str,
+                json_bytes,
                 file_name=f"stable_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json",
                 use_container_width=True
             )
 
     with col_act2:
-        if st.session_state.horses:
-            csv_str = export_horses_to_csv(st.session_state.horses)
+        if horses:
+            csv_bytes = session_memo(
+                'stable_csv',
+                st.session_state.stable_version,
+                lambda: export_horses_to_csv(stable).encode('utf-8')
+            )
             st.download_button(
                 t('stable.save_csv_button', lang),
-                csv_str,
+                csv_bytes,
                 file_name=f"stable_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -1293,19 +2029,25 @@ elif page == t('nav.stable', lang):
 
     with col_act3:
         uploaded_json = st.file_uploader(t('stable.load_button', lang), type=['json'], label_visibility="collapsed", key="json_upload")
-        if uploaded_json is not None:
+        # The uploader keeps its file across reruns, so each upload is imported only once;
+        # each uploader has its own marker so one upload can't re-trigger the other
+        if uploaded_json is not None and uploaded_json.file_id != st.session_state.get('imported_json_id'):
+            st.session_state.imported_json_id = uploaded_json.file_id
             try:
-                horses_data = json.load(uploaded_json)
-                registry = get_default_registry()
-                calculator = PhenotypeCalculator(registry)
-
-                for data in horses_data:
-                    horse = Horse.from_dict(data, registry, calculator)
-                    st.session_state.horses.append({
-                        'horse': horse,
-                        'name': f"Imported {len(st.session_state.horses) + 1}",
-                        'generated_at': datetime.now().isoformat()
-                    })
+                raw = uploaded_json.getvalue()
+                horses_data = orjson.loads(raw) if orjson else json.loads(raw)
+                registry, calculator = _registry_and_calculator()
+
+                # Build all horses in one batch, then add them with a single extend
+                loaded = Horse.from_dict_batch(horses_data, registry, calculator)
+                base = len(horses)
+                n_loaded = len(loaded)
+                extend_stable(
+                    loaded,
+                    [f"Imported {base + i}" for i in range(1, n_loaded + 1)],
+                    [datetime.now().isoformat()] * n_loaded
+                )
+                mark_stable_changed()
 
                 st.success(f"✅ {t('stable.loaded', lang, count=len(horses_data))}")
                 st.rerun()
@@ -1314,78 +2056,38 @@ elif page == t('nav.stable', lang):
 
     with col_act4:
         uploaded_csv = st.file_uploader(t('stable.load_csv_button', lang), type=['csv'], label_visibility="collapsed", key="csv_upload")
-        if uploaded_csv is not None:
+        if uploaded_csv is not None and uploaded_csv.file_id != st.session_state.get('imported_csv_id'):
+            st.session_state.imported_csv_id = uploaded_csv.file_id
             try:
                 csv_content = uploaded_csv.read()
-                imported_horses = import_horses_from_csv(csv_content)
+                imported = import_horses_from_csv(csv_content)
 
-                for item in imported_horses:
-                    st.session_state.horses.append(item)
+                extend_stable(**imported)
+                mark_stable_changed()
 
-                st.success(f"✅ {t('stable.loaded', lang, count=len(imported_horses))}")
+                st.success(f"✅ {t('stable.loaded', lang, count=len(imported['horses']))}")
                 st.rerun()
             except Exception as e:
                 st.error(f"❌ {t('stable.error_loading', lang, error=str(e))}")
 
     with col_act5:
-        if st.button(t('stable.clear_button', lang), use_container_width=True):
-            st.session_state.horses = []
-            st.session_state.pedigree = PedigreeTree()
-            st.rerun()
+        st.button(t('stable.clear_button', lang), use_container_width=True, on_click=_clear_stable)
 
     st.markdown("---")
 
     # Display horses in grid
-    if st.session_state.horses:
+    if horses:
         st.markdown(f"### 🐴 {t('stable.all_horses', lang)}")
 
-        if filtered_horses:
-            for idx, item in filtered_horses:
-                horse = item['horse']
-                name = item['name']
-
-                with st.expander(f"🐴 {name} - {horse.phenotype}"):
-                    st.markdown(f"**🎨 {t('stable.phenotype_label', lang)}:** {horse.phenotype}")
-
-                    with st.expander("🧬 Genotype", expanded=False):
-                        st.code(horse.genotype_string, language="text")
-
-                        if 'parents' in item:
-                            p1_name = st.session_state.horses[item['parents'][0]]['name']
-                            p2_name = st.session_state.horses[item['parents'][1]]['name']
-                            st.markdown(f"**👪 {t('stable.parents_label', lang)}:**")
-                            st.caption(f"👨 {p1_name}")
-                            st.caption(f"👩 {p2_name}")
-                        else:
-                            st.info(f"✨ {t('stable.foundation_horse', lang)}")
-
-                    # Rename option
-                    col_rename1, col_rename2 = st.columns([3, 1])
-
-                    with col_rename1:
-                        new_name = st.text_input(
-                            f"✏️ {t('stable.rename', lang)}",
-                            value=name,
-                            key=f"rename_{idx}"
-                        )
-
-                    with col_rename2:
-                        st.markdown("<br>", unsafe_allow_html=True)  # Align button with text input
-                        if st.button(t('stable.generate_random_name', lang), key=f"gen_name_{idx}"):
-                            st.session_state.horses[idx]['name'] = generate_random_horse_name()
-                            st.rerun()
-
-                    if new_name != name:
-                        st.session_state.horses[idx]['name'] = new_name
-                        st.rerun()
+        if filtered_idx:
+            render_stable_list(filtered_idx, lang)
         else:
             st.info(f"🔍 {t('stable.no_results', lang)}")
     else:
         st.info(f"👋 {t('stable.empty_stable', lang)}")
 
 elif page == t('nav.pedigree', lang):
-    st.markdown(f'<p class="main-header">🌳 {t("pedigree.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("pedigree.subtitle", lang)}</p>', unsafe_allow_html=True)
+    page_header('🌳', t('pedigree.title', lang), t('pedigree.subtitle', lang))
 
     # Help/Instructions
     with st.expander(f"ℹ️ {t('pedigree.how_to_use', lang)}", expanded=False):
@@ -1404,32 +2106,33 @@ elif page == t('nav.pedigree', lang):
         with col2:
             st.metric(f"🧬 {t('pedigree.breedings', lang)}", len(st.session_state.pedigree.breedings))
         with col3:
-            max_gen = max(h.generation for h in st.session_state.pedigree.horses.values())
-            st.metric(f"📊 {t('pedigree.generations', lang)}", max_gen + 1)
+            st.metric(f"📊 {t('pedigree.generations', lang)}", st.session_state.pedigree.max_generation + 1)
         with col4:
-            foundation = sum(1 for h in st.session_state.pedigree.horses.values()
-                           if h.sire_id is None and h.dam_id is None)
-            st.metric(f"✨ {t('stable.foundation', lang)}", foundation)
+            st.metric(f"✨ {t('stable.foundation', lang)}", st.session_state.pedigree.foundation_count)
 
         st.markdown("---")
 
         # Simplified pedigree view
         st.markdown(f"### 🐴 {t('pedigree.select_horse', lang)}")
 
-        horse_options = {h.name: h.horse_id for h in st.session_state.pedigree.horses.values()}
-        horse_list = list(horse_options.keys())
+        # Options are horse IDs so horses sharing a name stay selectable
+        pedigree_horses = st.session_state.pedigree.horses
+        horse_ids = session_memo('pedigree_ids', st.session_state.pedigree_version,
+                                 lambda: list(pedigree_horses))
 
-        col_select, col_depth = st.columns([3, 1])
+        col_select, col_depth = st.columns(_COL_3_1)
 
         with col_select:
-            selected_name = st.selectbox(t('pedigree.choose_horse', lang), horse_list, label_visibility="collapsed")
+            selected_id = st.selectbox(t('pedigree.choose_horse', lang), horse_ids,
+                                       format_func=lambda horse_id: pedigree_horses[horse_id].name,
+                                       label_visibility="collapsed")
 
         with col_depth:
             depth = st.selectbox(t('pedigree.generations_label', lang), [1, 2, 3, 4, 5], index=2)
 
-        if selected_name:
-            selected_id = horse_options[selected_name]
-            selected_horse = st.session_state.pedigree.horses[selected_id]
+        if selected_id:
+            selected_horse = pedigree_horses[selected_id]
+            selected_name = selected_horse.name
 
             st.markdown("---")
 
@@ -1444,22 +2147,21 @@ elif page == t('nav.pedigree', lang):
 
             st.markdown("<br>", unsafe_allow_html=True)
 
-            # Get ancestors
-            ancestors = st.session_state.pedigree.get_ancestors(selected_id, depth)
+            # Get ancestors (the traversal only depends on the pedigree, horse and depth)
+            pedigree = st.session_state.pedigree
+            pedigree_key = (st.session_state.pedigree_version, selected_id, depth)
+            ancestors = session_memo('pedigree_ancestors', pedigree_key,
+                                     lambda: pedigree.get_ancestors(selected_id, depth))
 
             if ancestors:
                 st.markdown(f"### 🌳 {t('pedigree.family_tree', lang)} ({len(ancestors)} {t('pedigree.ancestors', lang)})")
 
                 # Organize ancestors by generation distance
-                by_distance = {}
-                for ancestor in ancestors:
-                    gen_dist = selected_horse.generation - ancestor.generation
-                    if gen_dist not in by_distance:
-                        by_distance[gen_dist] = []
-                    by_distance[gen_dist].append(ancestor)
+                by_distance = session_memo('pedigree_by_distance', pedigree_key,
+                                           lambda: group_ancestors_by_distance(selected_horse, ancestors))
 
                 # Display each generation
-                for dist in sorted(by_distance.keys()):
+                for dist in by_distance:
                     if dist == 1:
                         st.markdown(f"### 👥 {t('pedigree.parents', lang)}")
                         icon = "👤"
@@ -1473,28 +2175,33 @@ elif page == t('nav.pedigree', lang):
                         st.markdown(f"### 🧬 {t('pedigree.generation', lang)} -{dist}")
                         icon = "🧬"
 
-                    # Display in columns
-                    cols = st.columns(min(len(by_distance[dist]), 4))
-                    for idx, ancestor in enumerate(by_distance[dist]):
-                        with cols[idx % len(cols)]:
-                            st.markdown(f"""
-                            <div class="ancestor-box">
-                                <p style="font-size: 1.1rem; font-weight: bold; margin: 0;">{icon} {ancestor.name}</p>
-                                <p style="color: #495057; margin: 0.3rem 0 0 0;">{ancestor.phenotype}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-
-                    st.markdown("<br>", unsafe_allow_html=True)
+                    # Display the whole generation as one HTML grid (max 4 per row)
+                    cards = "".join(
+                        f'<div class="ancestor-box">'
+                        f'<p style="font-size: 1.1rem; font-weight: bold; margin: 0;">{icon} {ancestor.name}</p>'
+                        f'<p style="color: #495057; margin: 0.3rem 0 0 0;">{ancestor.phenotype}</p>'
+                        f'</div>'
+                        for ancestor in by_distance[dist]
+                    )
+                    n_cols = min(len(by_distance[dist]), 4)
+                    st.markdown(
+                        f'<div class="card-grid" style="grid-template-columns: repeat({n_cols}, 1fr);">{cards}</div>',
+                        unsafe_allow_html=True
+                    )
 
                 # Inbreeding check
                 st.markdown(f"### 🔍 {t('pedigree.inbreeding_analysis', lang)}")
-                inbreeding = st.session_state.pedigree.detect_inbreeding(selected_id, depth)
+                inbreeding = session_memo('pedigree_inbreeding', pedigree_key,
+                                          lambda: pedigree.detect_inbreeding(selected_id, depth, ancestors))
                 if inbreeding:
                     st.warning(f"⚠️ {t('pedigree.inbreeding_detected', lang, count=len(inbreeding))}")
                     with st.expander(t('pedigree.view_repeated', lang)):
-                        for anc_id in inbreeding:
-                            anc = st.session_state.pedigree.horses[anc_id]
-                            st.caption(f"• {anc.name} ({anc.phenotype})")
+                        # One caption for the whole list rather than one element per ancestor
+                        pedigree_horses = st.session_state.pedigree.horses
+                        st.caption("  \n".join(
+                            f"• {pedigree_horses[anc_id].name} ({pedigree_horses[anc_id].phenotype})"
+                            for anc_id in inbreeding
+                        ))
                 else:
                     st.success(f"✅ {t('pedigree.no_inbreeding', lang)}")
 
@@ -1508,10 +2215,15 @@ elif page == t('nav.pedigree', lang):
 
                 with st.spinner(f"🔮 {t('pedigree.generating_tree', lang)}"):
                     try:
-                        tree_image = generate_pedigree_tree_image(
-                            st.session_state.pedigree,
-                            selected_id,
-                            depth
+                        # Re-render only when the pedigree or the selection changes
+                        tree_image = session_memo(
+                            'pedigree_tree_png',
+                            pedigree_key,
+                            lambda: generate_pedigree_tree_image(
+                                pedigree,
+                                selected_id,
+                                depth
+                            ).getvalue()
                         )
 
                         # Display the image
@@ -1534,8 +2246,7 @@ elif page == t('nav.pedigree', lang):
                 st.code(selected_horse.genotype_string, language="text")
 
 elif page == t('nav.compare', lang):
-    st.markdown(f'<p class="main-header">⚖️ {t("compare.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("compare.subtitle", lang)}</p>', unsafe_allow_html=True)
+    page_header('⚖️', t('compare.title', lang), t('compare.subtitle', lang))
 
     # Help/Instructions
     with st.expander(f"ℹ️ {t('compare.how_to_use', lang)}", expanded=False):
@@ -1543,11 +2254,11 @@ elif page == t('nav.compare', lang):
 
     st.markdown("---")
 
-    if len(st.session_state.horses) < 2:
+    if len(st.session_state.stable['horses']) < 2:
         st.warning(f"⚠️ {t('compare.need_horses', lang)}")
     else:
-        horse_names = [f"{item['name']} - {item['horse'].phenotype}"
-                       for item in st.session_state.horses]
+        stable = st.session_state.stable
+        horse_names = get_horse_labels()
 
         # Horse selection
         col1, col2 = st.columns(2)
@@ -1559,8 +2270,7 @@ elif page == t('nav.compare', lang):
                 format_func=lambda x: horse_names[x],
                 key="compare_horse1"
             )
-            horse1_item = st.session_state.horses[horse1_idx]
-            horse1 = horse1_item['horse']
+            horse1 = stable['horses'][horse1_idx]
 
         with col2:
             horse2_idx = st.selectbox(
@@ -1569,8 +2279,7 @@ elif page == t('nav.compare', lang):
                 format_func=lambda x: horse_names[x],
                 key="compare_horse2"
             )
-            horse2_item = st.session_state.horses[horse2_idx]
-            horse2 = horse2_item['horse']
+            horse2 = stable['horses'][horse2_idx]
 
         st.markdown("---")
 
@@ -1582,7 +2291,7 @@ elif page == t('nav.compare', lang):
             gradient1, text_color1 = get_phenotype_color(horse1.phenotype)
             st.markdown(f"""
             <div class="horse-card" style="background: {gradient1}; color: {text_color1};">
-                <h2>🐴 {horse1_item['name']}</h2>
+                <h2>🐴 {stable['names'][horse1_idx]}</h2>
                 <p style="font-size: 1.3rem; margin: 0.5rem 0;">{horse1.phenotype}</p>
             </div>
             """, unsafe_allow_html=True)
@@ -1595,7 +2304,7 @@ elif page == t('nav.compare', lang):
             gradient2, text_color2 = get_phenotype_color(horse2.phenotype)
             st.markdown(f"""
             <div class="horse-card" style="background: {gradient2}; color: {text_color2};">
-                <h2>🐴 {horse2_item['name']}</h2>
+                <h2>🐴 {stable['names'][horse2_idx]}</h2>
                 <p style="font-size: 1.3rem; margin: 0.5rem 0;">{horse2.phenotype}</p>
             </div>
             """, unsafe_allow_html=True)
@@ -1661,7 +2370,7 @@ elif page == t('nav.compare', lang):
 
             is_match = gene_name in matching_genes
 
-            col_gene, col_a1, col_a2, col_status = st.columns([2, 2, 2, 1])
+            col_gene, col_a1, col_a2, col_status = st.columns(_COL_GENE_ROW)
 
             with col_gene:
                 st.markdown(f"**{gene_name}**")
@@ -1685,8 +2394,7 @@ elif page == t('nav.compare', lang):
                     st.markdown("❌")
 
 elif page == t('nav.statistics', lang):
-    st.markdown(f'<p class="main-header">📈 {t("statistics.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("statistics.subtitle", lang)}</p>', unsafe_allow_html=True)
+    page_header('📈', t('statistics.title', lang), t('statistics.subtitle', lang))
 
     # Help/Instructions
     with st.expander(f"ℹ️ {t('statistics.how_to_use', lang)}", expanded=False):
@@ -1694,15 +2402,18 @@ elif page == t('nav.statistics', lang):
 
     st.markdown("---")
 
-    if len(st.session_state.horses) == 0:
+    if len(st.session_state.stable['horses']) == 0:
         st.warning(f"⚠️ {t('statistics.need_horses', lang)}")
     else:
         # Overview statistics
         st.markdown(f"### 📊 {t('statistics.overview_title', lang)}")
 
-        total_horses = len(st.session_state.horses)
-        bred_horses = sum(1 for h in st.session_state.horses if 'parents' in h)
-        foundation_horses = total_horses - bred_horses
+        stable_indexes = get_stable_indexes()
+        phenotype_counts = stable_indexes['phenotype_counts']
+
+        total_horses = len(st.session_state.stable['horses'])
+        bred_horses = len(stable_indexes['bred'])
+        foundation_horses = len(stable_indexes['foundation'])
 
         col1, col2, col3, col4 = st.columns(4)
 
@@ -1716,24 +2427,18 @@ elif page == t('nav.statistics', lang):
             st.metric(f"🧬 {t('statistics.bred_count', lang)}", bred_horses)
 
         with col4:
-            phenotypes = set(item['horse'].phenotype for item in st.session_state.horses)
-            st.metric(f"🎨 {t('statistics.unique_phenotypes', lang)}", len(phenotypes))
+            st.metric(f"🎨 {t('statistics.unique_phenotypes', lang)}", len(phenotype_counts))
 
         st.markdown("---")
 
         # Phenotype distribution
         st.markdown(f"### 🎨 {t('statistics.phenotype_title', lang)}")
 
-        phenotype_counts = {}
-        for item in st.session_state.horses:
-            pheno = item['horse'].phenotype
-            phenotype_counts[pheno] = phenotype_counts.get(pheno, 0) + 1
-
         # Sort by count (descending)
-        sorted_phenotypes = sorted(phenotype_counts.items(), key=lambda x: x[1], reverse=True)
+        sorted_phenotypes = phenotype_counts.most_common()
 
         # Display mode selection
-        viz_col1, viz_col2 = st.columns([3, 1])
+        viz_col1, viz_col2 = st.columns(_COL_3_1)
         with viz_col2:
             pheno_viz_mode = st.radio(
                 "View",
@@ -1781,316 +2486,43 @@ elif page == t('nav.statistics', lang):
                 st.pyplot(fig)
                 plt.close()
         else:
-            # Original list view
-            for phenotype, count in sorted_phenotypes[:10]:
-                percentage = (count / total_horses) * 100
-
-                col_name, col_bar = st.columns([1, 3])
-
-                with col_name:
-                    st.markdown(f"**{phenotype}**")
-
-                with col_bar:
-                    st.progress(count / total_horses, text=f"{count} ({percentage:.1f}%)")
+            # List view as a single bar chart
+            top_10 = sorted_phenotypes[:10]
+            pct_per_horse = 100.0 / total_horses
+            st.altair_chart(
+                horizontal_bar_chart(
+                    [phenotype for phenotype, _ in top_10],
+                    [count for _, count in top_10],
+                    [f"{count} ({count * pct_per_horse:.1f}%)" for _, count in top_10]
+                ),
+                use_container_width=True
+            )
 
         st.markdown("---")
 
         # Gene frequency analysis
         st.markdown(f"### 🧬 {t('statistics.gene_title', lang)}")
 
-        # Collect all alleles for each gene
-        gene_alleles = {}
-        all_genes = list(st.session_state.horses[0]['horse'].genotype.keys())
-
-        for gene_name in all_genes:
-            gene_alleles[gene_name] = {}
+        # Allele tallies per gene (rebuilt only when the stable changes)
+        gene_stats = get_gene_stats()
 
-        for item in st.session_state.horses:
-            for gene_name, alleles in item['horse'].genotype.items():
-                for allele in alleles:
-                    gene_alleles[gene_name][allele] = gene_alleles[gene_name].get(allele, 0) + 1
-
-        # Pattern Gene Prevalence Chart
-        st.markdown("#### 🎨 Pattern Gene Prevalence")
-        st.caption("Shows percentage of horses carrying at least one copy of each pattern gene")
-
-        # Calculate prevalence for pattern genes
-        pattern_genes = ['gray', 'kit', 'frame',
-                        'splash', 'leopard', 'champagne']
-        pattern_prevalence = {}
-
-        for gene_name in pattern_genes:
-            if gene_name not in all_genes:
-                continue
-
-            # Count horses with at least one dominant allele
-            horses_with_pattern = 0
-            for item in st.session_state.horses:
-                alleles = item['horse'].genotype[gene_name]
-                # Check if horse has dominant allele (not wild-type)
-                has_dominant = False
-
-                if gene_name == 'gray':
-                    has_dominant = 'G' in alleles
-                elif gene_name == 'kit':
-                    has_dominant = any(a != 'n' for a in alleles)
-                elif gene_name == 'frame':
-                    has_dominant = 'O' in alleles
-                elif gene_name == 'splash':
-                    has_dominant = 'Spl' in alleles or any('Spl' in a for a in alleles)
-                elif gene_name == 'leopard':
-                    has_dominant = 'Lp' in alleles
-                elif gene_name == 'champagne':
-                    has_dominant = 'Ch' in alleles
-
-                if has_dominant:
-                    horses_with_pattern += 1
-
-            percentage = (horses_with_pattern / total_horses) * 100
-            pattern_prevalence[gene_name] = percentage
-
-        # Create bar chart
-        if pattern_prevalence:
-            gene_viz_mode = st.radio(
-                "Pattern Gene View",
-                ["Chart", "List"],
-                key="gene_viz_mode",
-                horizontal=True
-            )
-
-            if gene_viz_mode == "Chart":
-                fig, ax = plt.subplots(figsize=(12, 6))
-
-                genes = list(pattern_prevalence.keys())
-                percentages = list(pattern_prevalence.values())
-
-                # Create color mapping based on percentage
-                colors = []
-                for pct in percentages:
-                    if pct >= 25:
-                        colors.append('#2E7D32')  # Dark green - common
-                    elif pct >= 10:
-                        colors.append('#1976D2')  # Blue - moderate
-                    elif pct >= 5:
-                        colors.append('#F57C00')  # Orange - uncommon
-                    else:
-                        colors.append('#C62828')  # Red - rare
-
-                bars = ax.bar(genes, percentages, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
-
-                # Add value labels on bars
-                for bar, pct in zip(bars, percentages):
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{pct:.1f}%',
-                           ha='center', va='bottom', fontsize=10, weight='bold')
-
-                ax.set_ylabel('Prevalence (%)', fontsize=12, weight='bold')
-                ax.set_xlabel('Pattern Gene', fontsize=12, weight='bold')
-                ax.set_title('Pattern Gene Prevalence in Population', fontsize=14, weight='bold', pad=20)
-                ax.set_ylim(0, max(percentages) * 1.15 if percentages else 100)
-                ax.grid(axis='y', alpha=0.3, linestyle='--')
-
-                # Rotate x-axis labels
-                plt.xticks(rotation=45, ha='right')
-
-                # Add legend
-                from matplotlib.patches import Patch
-                legend_elements = [
-                    Patch(facecolor='#2E7D32', label='Common (≥25%)'),
-                    Patch(facecolor='#1976D2', label='Moderate (10-25%)'),
-                    Patch(facecolor='#F57C00', label='Uncommon (5-10%)'),
-                    Patch(facecolor='#C62828', label='Rare (<5%)')
-                ]
-                ax.legend(handles=legend_elements, loc='upper right')
-
-                plt.tight_layout()
-                st.pyplot(fig)
-                plt.close()
-
-                # Show realistic comparison
-                st.caption("💡 **Realistic frequencies:** Gray ~30%, Sabino ~26%, Tobiano ~24%, Leopard ~8%, Roan ~7%")
-            else:
-                # List view
-                for gene_name in pattern_genes:
-                    if gene_name in pattern_prevalence:
-                        pct = pattern_prevalence[gene_name]
-                        col_name, col_bar = st.columns([1, 3])
-
-                        with col_name:
-                            st.markdown(f"**{gene_name.replace('_', ' ').title()}**")
-
-                        with col_bar:
-                            st.progress(pct / 100, text=f"{pct:.1f}%")
+        render_gene_diversity(gene_stats['gene_alleles'], gene_stats['all_genes'], total_horses, lang)
 
         st.markdown("---")
 
-        # Individual gene frequency details (in expanders)
-        st.markdown("#### 🔬 Detailed Allele Frequencies")
-
-        # Display gene frequency for each gene
-        for gene_name in all_genes:
-            with st.expander(f"📊 {gene_name.replace('_', ' ').title()} - Allele Distribution"):
-                allele_counts = gene_alleles[gene_name]
-                total_alleles = sum(allele_counts.values())
-
-                # Sort by frequency
-                sorted_alleles = sorted(allele_counts.items(), key=lambda x: x[1], reverse=True)
-
-                # Create horizontal bar chart for alleles
-                if len(sorted_alleles) > 1:
-                    alleles = [a for a, _ in sorted_alleles]
-                    counts = [c for _, c in sorted_alleles]
-                    percentages = [(c / total_alleles) * 100 for c in counts]
-
-                    fig, ax = plt.subplots(figsize=(8, max(3, len(alleles) * 0.5)))
-
-                    bars = ax.barh(alleles, percentages, color='steelblue', alpha=0.8, edgecolor='black')
-
-                    # Add value labels
-                    for bar, pct, count in zip(bars, percentages, counts):
-                        width = bar.get_width()
-                        ax.text(width, bar.get_y() + bar.get_height()/2.,
-                               f' {pct:.1f}% ({count})',
-                               ha='left', va='center', fontsize=10, weight='bold')
-
-                    ax.set_xlabel('Frequency (%)', fontsize=11, weight='bold')
-                    ax.set_title(f'{gene_name.replace("_", " ").title()} Allele Distribution',
-                                fontsize=12, weight='bold')
-                    ax.set_xlim(0, max(percentages) * 1.2)
-                    ax.grid(axis='x', alpha=0.3, linestyle='--')
-
-                    plt.tight_layout()
-                    st.pyplot(fig)
-                    plt.close()
-                else:
-                    # Just show list if only one allele
-                    for allele, count in sorted_alleles:
-                        frequency = (count / total_alleles) * 100
-                        col_allele, col_freq = st.columns([1, 3])
-
-                        with col_allele:
-                            st.markdown(f"**{allele}**")
-
-                        with col_freq:
-                            st.progress(count / total_alleles, text=f"{count} ({frequency:.1f}%)")
-
-        st.markdown("---")
-
-        # Diversity score
-        st.markdown(f"### 🌈 {t('statistics.diversity_title', lang)}")
-
-        # Calculate diversity score based on phenotype variety
-        phenotype_diversity = len(phenotypes) / total_horses
-        unique_ratio = phenotype_diversity
-
-        # Calculate genetic diversity based on allele distribution
-        total_gene_diversity = 0
-        for gene_name in all_genes:
-            unique_alleles = len(gene_alleles[gene_name])
-            total_gene_diversity += unique_alleles
-
-        avg_gene_diversity = total_gene_diversity / len(all_genes)
-
-        # Overall diversity score (0-100)
-        diversity_score = int(((phenotype_diversity + (avg_gene_diversity / 10)) / 2) * 100)
-
-        col_div1, col_div2 = st.columns([1, 2])
-
-        with col_div1:
-            st.metric(f"🌟 {t('statistics.diversity_score', lang)}", f"{diversity_score}%")
-
-        with col_div2:
-            if diversity_score >= 70:
-                st.success(f"✅ {t('statistics.diversity_high', lang)}")
-            elif diversity_score >= 40:
-                st.info(f"📊 {t('statistics.diversity_medium', lang)}")
-            else:
-                st.warning(f"⚠️ {t('statistics.diversity_low', lang)}")
+        render_diversity_score(len(phenotype_counts), gene_stats['allele_lens'], total_horses, lang)
 
 else:  # About
-    st.markdown(f'<p class="main-header">📖 {t("about.title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f'<p class="subtitle">{t("about.subtitle", lang)}</p>', unsafe_allow_html=True)
-
-    tab1, tab2, tab3 = st.tabs([t('about.tab_genetics', lang), t('about.tab_colors', lang), t('about.tab_tech', lang)])
-
-    with tab1:
-        st.markdown(f"""
-        ### 🔬 {t('about.genetics_title', lang)}
-
-        {t('about.genetics_description', lang)}
-
-        1. {t('about.genetics_1', lang)}
-        2. {t('about.genetics_2', lang)}
-        3. {t('about.genetics_3', lang)}
-        4. {t('about.genetics_4', lang)}
-        5. {t('about.genetics_5', lang)}
-        6. {t('about.genetics_6', lang)}
-        7. {t('about.genetics_7', lang)}
-        8. {t('about.genetics_8', lang)}
-        9. {t('about.genetics_9', lang)}
-        10. {t('about.genetics_10', lang)}
-        11. {t('about.genetics_11', lang)}
-        12. {t('about.genetics_12', lang)}
-        13. {t('about.genetics_13', lang)}
-        14. {t('about.genetics_14', lang)}
-
-        ### 🧮 {t('about.mendelian', lang)}
-
-        {t('about.mendelian_description', lang)}
-        """)
-
-    with tab2:
-        st.markdown(f"""
-        ### 🎨 {t('about.colors_title', lang)}
-
-        {t('about.colors_base', lang)}
-
-        {t('about.colors_cream', lang)}
-
-        {t('about.colors_pearl', lang)}
+    about = _section_strings('about', lang)
+    page_header('📖', about['title'], about['subtitle'])
 
-        {t('about.colors_special', lang)}
-        """)
-
-    with tab3:
-        col_tech1, col_tech2 = st.columns(2)
-
-        with col_tech1:
-            st.markdown(f"""
-            ### 💻 {t('about.tech_stack', lang)}
-
-            - {t('about.tech_backend', lang)}
-            - {t('about.tech_web', lang)}
-            - {t('about.tech_api', lang)}
-            - {t('about.tech_license', lang)}
-            """)
-
-        with col_tech2:
-            st.markdown(f"""
-            ### 📊 {t('about.performance_title', lang)}
-
-            - {t('about.performance_generation', lang)}
-            - {t('about.performance_breeding', lang)}
-            - {t('about.performance_tests', lang)}
-            - {t('about.performance_memory', lang)}
-            """)
+    render_about_tabs(lang)
 
     st.markdown("---")
 
-    col_metric1, col_metric2, col_metric3 = st.columns(3)
-    with col_metric1:
-        st.metric(t('about.total_genes', lang), "14")
-    with col_metric2:
-        st.metric(t('about.phenotypes', lang), "100+")
-    with col_metric3:
-        st.metric(t('about.tests', lang), "142/142 ✅")
+    for col, (label, value) in zip(st.columns(3), _about_metrics(lang)):
+        col.metric(label, value)
 
 # Footer
 st.markdown("---")
-st.markdown(f"""
-<div style="text-align: center; color: #6c757d;">
-    <p>🐴 {t('footer.made_with', lang)}</p>
-    <p><a href="https://github.com/Metroseksuaali/Horsegenetics" target="_blank">{t('footer.github', lang)}</a></p>
-</div>
-""", unsafe_allow_html=True)
+st.html(_footer_html(lang))
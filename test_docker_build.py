@@ -4,8 +4,32 @@ Docker Build Verification Test
 Tests all critical functionality before Docker deployment
 """
 
+import os
+import random
+import re
 import sys
 import traceback
+from collections import Counter
+
+# Genetics names used by the checks. A broken package must not crash the script
+# before main() runs: test_imports re-imports and reports the error, and main()
+# then skips the checks that need these names.
+try:
+    from genetics.horse import Horse
+    from genetics.breed_presets import get_preset_manager
+except Exception:
+    pass
+
+# Phenotype keywords counted by test_realistic_distributions, mapped to their pattern
+_PATTERN_KEYS = {
+    'gray': 'gray',
+    'tobiano': 'tobiano',
+    'leopard': 'leopard',
+    'blanket': 'leopard',
+    'fewspot': 'leopard',
+    'roan': 'roan',
+}
+_PATTERN_RE = re.compile('|'.join(_PATTERN_KEYS))
 
 def test_imports():
     """Test that all modules can be imported."""
@@ -28,8 +52,6 @@ def test_random_generation():
     """Test random horse generation."""
     print("\n🎲 Testing random horse generation...")
     try:
-        from genetics.horse import Horse
-
         # Test basic generation
         horse = Horse.random()
         assert horse.phenotype, "Phenotype should not be empty"
@@ -38,7 +60,7 @@ def test_random_generation():
 
         # Test with excluded genes
         horse2 = Horse.random(excluded_genes={'gray'})
-        assert 'gray' not in horse2.phenotype.lower() or 'gray' in horse2.phenotype.lower(), "Excluded genes test"
+        assert 'gray' not in horse2.phenotype.lower(), f"Excluded gene leaked: {horse2.phenotype}"
         print(f"  ✅ Excluded genes: {horse2.phenotype}")
 
         # Test with custom probabilities
@@ -55,8 +77,6 @@ def test_breeding():
     """Test horse breeding."""
     print("\n🧬 Testing breeding...")
     try:
-        from genetics.horse import Horse
-
         parent1 = Horse.random()
         parent2 = Horse.random()
         foal = Horse.breed(parent1, parent2)
@@ -78,9 +98,6 @@ def test_breed_presets():
     """Test breed preset system."""
     print("\n🏇 Testing breed presets...")
     try:
-        from genetics.horse import Horse
-        from genetics.breed_presets import get_preset_manager
-
         manager = get_preset_manager()
 
         # Test realistic breeds
@@ -101,10 +118,7 @@ def test_breed_presets():
         print(f"  ✅ Arabian preset: {arabian.description}")
 
         # Generate Arabian horse
-        horse = Horse.random(
-            excluded_genes=arabian.excluded_genes,
-            custom_probabilities=arabian.custom_probabilities
-        )
+        horse = Horse.random(**arabian.random_kwargs)
         print(f"     Generated: {horse.phenotype}")
 
         return True
@@ -117,14 +131,17 @@ def test_streamlit_syntax():
     """Test that streamlit_app.py has no syntax errors."""
     print("\n📱 Testing Streamlit app syntax...")
     try:
-        import py_compile
-        import tempfile
-
-        # Compile streamlit_app.py to check for syntax errors
-        py_compile.compile('streamlit_app.py', doraise=True)
+        # Compile streamlit_app.py in memory to check for syntax errors
+        # (py_compile would also write a .pyc we never use)
+        with open('streamlit_app.py', 'rb') as f:
+            compile(f.read(), 'streamlit_app.py', 'exec')
         print("  ✅ streamlit_app.py has no syntax errors")
 
         return True
+    except SyntaxError as e:
+        # The error carries the location; a traceback would only point at compile()
+        print(f"  ❌ Syntax error in {e.filename} line {e.lineno}: {e.msg}")
+        return False
     except Exception as e:
         print(f"  ❌ Streamlit syntax check failed: {e}")
         traceback.print_exc()
@@ -134,8 +151,6 @@ def test_genotype_parsing():
     """Test genotype string parsing."""
     print("\n🧪 Testing genotype parsing...")
     try:
-        from genetics.horse import Horse
-
         # Test parsing (using correct gene labels)
         genotype_str = "E:E/e A:A/a Dil:N/Cr D:D/nd2 Z:n/n Ch:n/n F:f/f STY:sty/sty G:g/g To:n/n O:n/n Sb:n/n Spl:n/n Rn:n/n Lp:lp/lp W:n/n PATN1:n/n"
         horse = Horse.from_string(genotype_str)
@@ -155,28 +170,15 @@ def test_realistic_distributions():
     """Test that gene distributions are realistic."""
     print("\n📊 Testing realistic distributions (100 horses)...")
     try:
-        from genetics.horse import Horse
-
-        horses = [Horse.random() for _ in range(100)]
-
-        # Count pattern genes
-        pattern_counts = {
-            'gray': 0,
-            'tobiano': 0,
-            'leopard': 0,
-            'roan': 0,
-        }
-
-        for horse in horses:
-            pheno = horse.phenotype.lower()
-            if 'gray' in pheno:
-                pattern_counts['gray'] += 1
-            if 'tobiano' in pheno:
-                pattern_counts['tobiano'] += 1
-            if 'leopard' in pheno or 'blanket' in pheno or 'fewspot' in pheno:
-                pattern_counts['leopard'] += 1
-            if 'roan' in pheno:
-                pattern_counts['roan'] += 1
+        horses = Horse.random_batch(100)
+
+        # Count pattern genes: one regex pass per phenotype, and the per-horse
+        # set counts each pattern at most once per horse
+        pattern_counts = Counter(
+            pattern
+            for horse in horses
+            for pattern in {_PATTERN_KEYS[match] for match in _PATTERN_RE.findall(horse.phenotype.lower())}
+        )
 
         # Check ranges (with some tolerance for small sample)
         gray_pct = pattern_counts['gray']
@@ -208,6 +210,12 @@ def main():
     print("🐴 Horse Genetics Docker Build Verification")
     print("=" * 60)
 
+    # Optional fixed seed so a failing run (e.g. a distribution check) can be reproduced
+    seed = os.environ.get('HORSE_TEST_SEED')
+    if seed is not None:
+        random.seed(int(seed))
+        print(f"🌱 Using HORSE_TEST_SEED={seed}")
+
     tests = [
         ("Imports", test_imports),
         ("Random Generation", test_random_generation),
@@ -218,30 +226,31 @@ def main():
         ("Realistic Distributions", test_realistic_distributions),
     ]
 
-    results = []
+    # Check name -> passed, in run order
+    results = {}
     for name, test_func in tests:
         try:
-            result = test_func()
-            results.append((name, result))
+            results[name] = test_func()
         except Exception as e:
             print(f"\n❌ Unexpected error in {name}: {e}")
             traceback.print_exc()
-            results.append((name, False))
+            results[name] = False
+
+        # Every other check needs the genetics package; stop at the first failure
+        if test_func is test_imports and not results[name]:
+            print("\n⏭️  Core modules failed to import - skipping remaining tests")
+            break
 
     print("\n" + "=" * 60)
     print("📋 TEST RESULTS")
     print("=" * 60)
 
-    passed = 0
-    failed = 0
-
-    for name, result in results:
+    for name, result in results.items():
         status = "✅ PASS" if result else "❌ FAIL"
         print(f"{status}: {name}")
-        if result:
-            passed += 1
-        else:
-            failed += 1
+
+    passed = sum(1 for result in results.values() if result)
+    failed = len(results) - passed
 
     print("=" * 60)
     print(f"Total: {passed} passed, {failed} failed out of {len(results)} tests")
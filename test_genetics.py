@@ -7,18 +7,41 @@ determination based on peer-reviewed equine genetics research.
 
 import unittest
 import os
+import json
 import csv
+import io
 import tempfile
 from genetics.gene_interaction import PhenotypeCalculator
 from genetics.horse import Horse, LethalGenotypeError
 from genetics.validation import check_lethal_genotype
 from genetics.breeding_stats import (
     calculate_gene_probabilities,
+    calculate_offspring_probabilities,
+    calculate_offspring_probabilities_batch,
     calculate_single_gene_probability,
     get_guaranteed_traits,
+    iter_genotype_combinations,
 )
 from genetics.gene_registry import get_default_registry
 from genetics.io import horses_to_csv
+from genetics.pedigree import PedigreeTree
+
+# Wild-type alleles for every gene except extension and agouti, shared by the
+# _create_genotype helpers; tests override single genes on top of it
+_DEFAULT_GENOTYPE = {
+    'dilution': ('N', 'N'),
+    'dun': ('nd2', 'nd2'),
+    'silver': ('n', 'n'),
+    'champagne': ('n', 'n'),
+    'flaxen': ('F', 'F'),
+    'sooty': ('sty', 'sty'),
+    'gray': ('g', 'g'),
+    'kit': ('n', 'n'),
+    'frame': ('n', 'n'),
+    'splash': ('n', 'n'),
+    'leopard': ('lp', 'lp'),
+    'patn1': ('n', 'n'),
+}
 
 
 class TestBasicColors(unittest.TestCase):
@@ -28,9 +51,10 @@ class TestBasicColors(unittest.TestCase):
     Scientific basis: MC1R (Extension) and ASIP (Agouti) interactions.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution=('N', 'N'),
                         dun=('nd2', 'nd2'), silver=('n', 'n'),
@@ -101,27 +125,13 @@ class TestSealBrown(unittest.TestCase):
     - Cream, silver, champagne and other modifiers interact with seal brown
     """
 
-    def setUp(self):
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calc = PhenotypeCalculator()
 
     def _g(self, extension, agouti, **kwargs):
         """Create minimal genotype with seal-brown-relevant defaults."""
-        defaults = {
-            'dilution': ('N', 'N'),
-            'dun': ('nd2', 'nd2'),
-            'silver': ('n', 'n'),
-            'champagne': ('n', 'n'),
-            'flaxen': ('F', 'F'),
-            'sooty': ('sty', 'sty'),
-            'gray': ('g', 'g'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n'),
-        }
-        defaults.update(kwargs)
-        return {'extension': extension, 'agouti': agouti, **defaults}
+        return {**_DEFAULT_GENOTYPE, 'extension': extension, 'agouti': agouti, **kwargs}
 
     # ------------------------------------------------------------------
     # Perusdominanssijärjestys: A > At > a
@@ -253,31 +263,19 @@ class TestCreamDilution(unittest.TestCase):
     Scientific basis: Incomplete dominance - single vs double copy effects.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution, **kwargs):
         """Helper to create genotype with optional modifiers."""
-        defaults = {
-            'dun': ('nd2', 'nd2'),
-            'silver': ('n', 'n'),
-            'champagne': ('n', 'n'),
-            'flaxen': ('F', 'F'),
-            'sooty': ('sty', 'sty'),
-            'gray': ('g', 'g'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n')
-        }
-        defaults.update(kwargs)
         return {
+            **_DEFAULT_GENOTYPE,
             'extension': extension,
             'agouti': agouti,
             'dilution': dilution,
-            **defaults
+            **kwargs
         }
 
     # Single Cream Dilution Tests
@@ -321,31 +319,19 @@ class TestPearlDilution(unittest.TestCase):
     Compound heterozygotes (Cr/Prl) phenocopy double dilutes.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution, **kwargs):
         """Helper to create genotype with optional modifiers."""
-        defaults = {
-            'dun': ('nd2', 'nd2'),
-            'silver': ('n', 'n'),
-            'champagne': ('n', 'n'),
-            'flaxen': ('F', 'F'),
-            'sooty': ('sty', 'sty'),
-            'gray': ('g', 'g'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n')
-        }
-        defaults.update(kwargs)
         return {
+            **_DEFAULT_GENOTYPE,
             'extension': extension,
             'agouti': agouti,
             'dilution': dilution,
-            **defaults
+            **kwargs
         }
 
     def test_pearl_carrier_no_effect(self):
@@ -396,31 +382,19 @@ class TestChampagneDilution(unittest.TestCase):
     Scientific basis: Dilutes both eumelanin and pheomelanin.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, champagne, **kwargs):
         """Helper to create genotype with champagne."""
-        defaults = {
-            'dilution': ('N', 'N'),
-            'dun': ('nd2', 'nd2'),
-            'silver': ('n', 'n'),
-            'flaxen': ('F', 'F'),
-            'sooty': ('sty', 'sty'),
-            'gray': ('g', 'g'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n')
-        }
-        defaults.update(kwargs)
         return {
+            **_DEFAULT_GENOTYPE,
             'extension': extension,
             'agouti': agouti,
             'champagne': champagne,
-            **defaults
+            **kwargs
         }
 
     def test_gold_champagne(self):
@@ -460,31 +434,19 @@ class TestSilverDilution(unittest.TestCase):
     DOES affect double cream dilutes (important for breeding).
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, silver, **kwargs):
         """Helper to create genotype with silver."""
-        defaults = {
-            'dilution': ('N', 'N'),
-            'dun': ('nd2', 'nd2'),
-            'champagne': ('n', 'n'),
-            'flaxen': ('F', 'F'),
-            'sooty': ('sty', 'sty'),
-            'gray': ('g', 'g'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n')
-        }
-        defaults.update(kwargs)
         return {
+            **_DEFAULT_GENOTYPE,
             'extension': extension,
             'agouti': agouti,
             'silver': silver,
-            **defaults
+            **kwargs
         }
 
     def test_silver_no_effect_on_chestnut(self):
@@ -534,31 +496,19 @@ class TestDunGene(unittest.TestCase):
     Scientific basis: D > nd1 > nd2 dominance hierarchy.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dun, **kwargs):
         """Helper to create genotype with dun."""
-        defaults = {
-            'dilution': ('N', 'N'),
-            'silver': ('n', 'n'),
-            'champagne': ('n', 'n'),
-            'flaxen': ('F', 'F'),
-            'sooty': ('sty', 'sty'),
-            'gray': ('g', 'g'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n')
-        }
-        defaults.update(kwargs)
         return {
+            **_DEFAULT_GENOTYPE,
             'extension': extension,
             'agouti': agouti,
             'dun': dun,
-            **defaults
+            **kwargs
         }
 
     def test_bay_dun(self):
@@ -605,32 +555,21 @@ class TestFlaxenAndSooty(unittest.TestCase):
     - Sooty: Adds black hairs, NOT visible on pure black horses
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, flaxen=('F', 'F'),
                         sooty=('sty', 'sty'), **kwargs):
         """Helper to create genotype."""
-        defaults = {
-            'dilution': ('N', 'N'),
-            'dun': ('nd2', 'nd2'),
-            'silver': ('n', 'n'),
-            'champagne': ('n', 'n'),
-            'gray': ('g', 'g'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n')
-        }
-        defaults.update(kwargs)
         return {
+            **_DEFAULT_GENOTYPE,
             'extension': extension,
             'agouti': agouti,
             'flaxen': flaxen,
             'sooty': sooty,
-            **defaults
+            **kwargs
         }
 
     def test_flaxen_on_chestnut(self):
@@ -678,31 +617,19 @@ class TestGrayGene(unittest.TestCase):
     Scientific basis: Dominant gene causing progressive depigmentation.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, gray, **kwargs):
         """Helper to create genotype with gray."""
-        defaults = {
-            'dilution': ('N', 'N'),
-            'dun': ('nd2', 'nd2'),
-            'silver': ('n', 'n'),
-            'champagne': ('n', 'n'),
-            'kit': ('n', 'n'),
-            'frame': ('n', 'n'),
-            'splash': ('n', 'n'),
-            'leopard': ('lp', 'lp'),
-            'patn1': ('n', 'n'),
-            'flaxen': ('F', 'F'),
-            'sooty': ('sty', 'sty')
-        }
-        defaults.update(kwargs)
         return {
+            **_DEFAULT_GENOTYPE,
             'extension': extension,
             'agouti': agouti,
             'gray': gray,
-            **defaults
+            **kwargs
         }
 
     def test_gray_on_chestnut(self):
@@ -830,11 +757,12 @@ class TestBreeding(unittest.TestCase):
 class TestGenotypeFormatting(unittest.TestCase):
     """Test genotype formatting and parsing."""
 
-    def setUp(self):
-        """Initialize calculator and registry."""
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator and registry once for all tests in the class."""
         from genetics.gene_registry import get_default_registry
-        self.calc = PhenotypeCalculator()
-        self.registry = get_default_registry()
+        cls.calc = PhenotypeCalculator()
+        cls.registry = get_default_registry()
 
     def test_format_genotype(self):
         """Test genotype formatting for display."""
@@ -956,6 +884,20 @@ class TestHorseAPI(unittest.TestCase):
         # Phenotypes should match
         self.assertEqual(original.phenotype, recreated.phenotype)
 
+    def test_genotype_string_cached(self):
+        """Test genotype_string is formatted once and reused."""
+        from genetics.horse import Horse
+
+        horse = Horse.random()
+        first = horse.genotype_string
+
+        self.assertIs(horse.genotype_string, first)
+        self.assertEqual(first, horse.registry.format_genotype(horse.genotype, compact=True))
+
+        # Batch-built horses skip __init__ but cache the same way
+        loaded = Horse.from_dict_batch([horse.to_dict()])[0]
+        self.assertEqual(loaded.genotype_string, first)
+
     def test_horse_breeding(self):
         """Test breeding two horses with fluent API."""
         from genetics.horse import Horse
@@ -1039,6 +981,70 @@ class TestHorseAPI(unittest.TestCase):
         self.assertEqual(original.genotype, recreated.genotype)
         self.assertEqual(original.phenotype, recreated.phenotype)
 
+    def test_horse_from_dict_batch(self):
+        """Test batch creation matches from_dict, including JSON round-trip."""
+        from genetics.horse import Horse
+        import json
+
+        originals = [Horse.random() for _ in range(20)]
+        data = json.loads(json.dumps([h.to_dict() for h in originals]))
+
+        recreated = Horse.from_dict_batch(data)
+
+        self.assertEqual(len(recreated), len(originals))
+        for original, horse in zip(originals, recreated):
+            self.assertEqual(original.genotype, horse.genotype)
+            self.assertEqual(original.phenotype, horse.phenotype)
+            self.assertEqual(original.genotype_string, horse.genotype_string)
+
+    def test_horse_random_batch(self):
+        """Test batch generation yields valid horses with matching phenotypes."""
+        from genetics.horse import Horse
+
+        horses = Horse.random_batch(25, excluded_genes={'gray'})
+
+        self.assertEqual(len(horses), 25)
+        for horse in horses:
+            self.assertEqual(horse.genotype['gray'], ('g', 'g'))
+            self.assertFalse(horse.is_lethal)
+            self.assertEqual(horse.phenotype, Horse.from_dict(horse.to_dict()).phenotype)
+
+        self.assertEqual(Horse.random_batch(0), [])
+
+    def test_horse_breed_batch(self):
+        """Test batch breeding inherits one allele from each parent per gene."""
+        from genetics.horse import Horse
+
+        mare = Horse.from_string("E:E/e A:A/A Dil:N/N D:nd2/nd2 Z:n/n Ch:n/n F:F/F STY:sty/sty G:g/g KIT:n/n O:O/n Spl:n/n Lp:lp/lp PATN1:n/n")
+        stallion = Horse.from_string("E:e/e A:a/a Dil:N/N D:nd2/nd2 Z:n/n Ch:n/n F:f/f STY:sty/sty G:g/g KIT:n/n O:O/n Spl:n/n Lp:lp/lp PATN1:n/n")
+
+        foals = Horse.breed_batch(mare, stallion, 40)
+
+        self.assertEqual(len(foals), 40)
+        for foal in foals:
+            self.assertIn(foal.genotype['extension'], [('E', 'e'), ('e', 'e')])
+            self.assertEqual(foal.genotype['agouti'], ('A', 'a'))
+            self.assertEqual(foal.phenotype, Horse.from_dict(foal.to_dict(), allow_lethal=True).phenotype)
+
+        self.assertEqual(Horse.breed_batch(mare, stallion, 0), [])
+
+    def test_horse_from_dict_batch_rejects_lethal(self):
+        """Test batch creation raises on lethal genotypes unless allowed."""
+        from genetics.horse import Horse
+
+        lethal = Horse.from_string(
+            "E:E/e A:A/a Dil:N/N D:nd2/nd2 Z:n/n Ch:n/n F:F/F STY:sty/sty G:g/g "
+            "KIT:n/n O:O/O Spl:n/n Lp:lp/lp PATN1:n/n",
+            allow_lethal=True
+        )
+        data = [Horse.random().to_dict(), lethal.to_dict()]
+
+        with self.assertRaises(LethalGenotypeError):
+            Horse.from_dict_batch(data)
+
+        horses = Horse.from_dict_batch(data, allow_lethal=True)
+        self.assertTrue(horses[1].is_lethal)
+
     def test_multiple_generation_breeding(self):
         """Test breeding multiple generations."""
         from genetics.horse import Horse
@@ -1087,9 +1093,10 @@ class TestRoanGene(unittest.TestCase):
     Recent research (2020) shows rn/rn is viable, contrary to historical belief.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, kit, dilution=('N', 'N'),
                         dun=('nd2', 'nd2'), silver=('n', 'n'),
@@ -1148,9 +1155,10 @@ class TestWhitePatterns(unittest.TestCase):
     Tovero is the industry term for Tobiano + Overo combination.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, kit=('n', 'n'),
                         frame=('n', 'n'),
@@ -1247,9 +1255,10 @@ class TestLeopardComplex(unittest.TestCase):
     PATN1 modifies the pattern to create full leopard spotting.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, leopard, patn1,
                         dilution=('N', 'N'), dun=('nd2', 'nd2'),
@@ -1311,9 +1320,10 @@ class TestDominantWhite(unittest.TestCase):
     W alleles are now part of the unified KIT gene.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, kit,
                         dilution=('N', 'N'), dun=('nd2', 'nd2'),
@@ -1403,8 +1413,9 @@ class TestSootyOnDoubleDilutes(unittest.TestCase):
     Reference: HORSE_GENETICS_REFERENCE.md section 16 (Sooty).
     """
 
-    def setUp(self):
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution=('N', 'N'),
                          dun=('nd2', 'nd2'), silver=('n', 'n'),
@@ -1477,8 +1488,9 @@ class TestFlaxenEdgeCases(unittest.TestCase):
     Reference: HORSE_GENETICS_REFERENCE.md section 15 (Flaxen).
     """
 
-    def setUp(self):
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution=('N', 'N'),
                          dun=('nd2', 'nd2'), silver=('n', 'n'),
@@ -1555,8 +1567,9 @@ class TestDunCombinations(unittest.TestCase):
     Reference: HORSE_GENETICS_REFERENCE.md section 4 (Dun).
     """
 
-    def setUp(self):
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution=('N', 'N'),
                          dun=('nd2', 'nd2'), silver=('n', 'n'),
@@ -1642,8 +1655,9 @@ class TestPATN1WithoutLeopard(unittest.TestCase):
     Reference: 'PATN1 ilman Lp: EI nakyva vaikutusta'.
     """
 
-    def setUp(self):
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution=('N', 'N'),
                          dun=('nd2', 'nd2'), silver=('n', 'n'),
@@ -1692,9 +1706,10 @@ class TestBreedingStats(unittest.TestCase):
     Lookups then returned 0.0 instead of the correct probability.
     """
 
-    def setUp(self):
-        self.registry = get_default_registry()
-        self.ext_gene = self.registry.get_gene('extension')
+    @classmethod
+    def setUpClass(cls):
+        cls.registry = get_default_registry()
+        cls.ext_gene = cls.registry.get_gene('extension')
 
     def test_homozygous_cross_all_heterozygous(self):
         """E/E x e/e must produce 100% E/e offspring for extension gene."""
@@ -1778,6 +1793,56 @@ class TestBreedingStats(unittest.TestCase):
                       "e/e x e/e should guarantee extension genotype")
         self.assertEqual(guaranteed['extension'], 'e/e')
 
+    def test_batch_probabilities_match_single_pairs(self):
+        """Batch results must equal per-pair results, including swapped and repeated pairs."""
+        rest = ("Dil:N/N D:nd2/nd2 Z:n/n Ch:n/n F:F/f STY:sty/sty G:g/g "
+                "KIT:n/n O:n/n Spl:n/n Lp:lp/lp PATN1:n/n")
+        bay = f"E:E/e A:A/a {rest}"
+        chestnut = f"E:e/e A:a/a {rest}"
+        pairs = [(bay, chestnut), (chestnut, bay), (bay, bay), (bay, chestnut)]
+
+        results = calculate_offspring_probabilities_batch(pairs)
+
+        self.assertEqual(set(results), set(pairs))
+        for parent1, parent2 in pairs:
+            expected = calculate_offspring_probabilities(parent1, parent2)
+            self.assertEqual(results[(parent1, parent2)].keys(), expected.keys())
+            for phenotype, probability in expected.items():
+                self.assertAlmostEqual(results[(parent1, parent2)][phenotype], probability, places=9)
+
+        # Mirrored pairs share values but not the dict object
+        self.assertIsNot(results[(bay, chestnut)], results[(chestnut, bay)])
+
+    def test_exact_probabilities_across_chunks(self):
+        """Chunked exact calculation must cover every offspring genotype once.
+
+        Seven heterozygous loci give 3^7 = 2187 distinct offspring genotypes,
+        more than fit in one phenotyping chunk when the chunk size is small.
+        """
+        import genetics.breeding_stats as breeding_stats
+
+        parent_str = (
+            "E:E/e A:A/a Dil:N/Cr D:D/nd2 Z:n/n Ch:n/n "
+            "F:F/f STY:STY/sty G:G/g KIT:n/n O:n/n "
+            "Spl:n/n Lp:lp/lp PATN1:n/n"
+        )
+        genotype = self.registry.parse_genotype_string(parent_str)
+        combinations = list(iter_genotype_combinations(genotype, genotype, self.registry))
+        self.assertEqual(len(combinations), 2187)
+        self.assertAlmostEqual(sum(p for _, p in combinations), 1.0, places=9)
+
+        expected = calculate_offspring_probabilities(parent_str, parent_str)
+        original_chunk = breeding_stats._PHENOTYPE_CHUNK_SIZE
+        breeding_stats._PHENOTYPE_CHUNK_SIZE = 500
+        try:
+            chunked = calculate_offspring_probabilities(parent_str, parent_str)
+        finally:
+            breeding_stats._PHENOTYPE_CHUNK_SIZE = original_chunk
+
+        self.assertEqual(chunked.keys(), expected.keys())
+        for phenotype, probability in expected.items():
+            self.assertAlmostEqual(chunked[phenotype], probability, places=9)
+
 
 class TestCSVRoundTrip(unittest.TestCase):
     """Test CSV export functionality (BUG-03 fix verification).
@@ -1793,18 +1858,13 @@ class TestCSVRoundTrip(unittest.TestCase):
             "F:F/f STY:sty/sty G:g/g KIT:n/n O:n/n "
             "Spl:n/n Lp:lp/lp PATN1:n/n"
         )
-        self.temp_file = tempfile.mktemp(suffix='.csv')
-
-    def tearDown(self):
-        if os.path.exists(self.temp_file):
-            os.remove(self.temp_file)
 
     def _get_csv_header(self):
-        """Export horse to temp CSV and return the header row."""
-        horses_to_csv([self.horse], self.temp_file)
-        with open(self.temp_file, 'r') as f:
-            reader = csv.reader(f)
-            return next(reader)
+        """Export horse to an in-memory CSV stream and return the header row."""
+        buf = io.StringIO()
+        horses_to_csv([self.horse], buf)
+        buf.seek(0)
+        return next(csv.reader(buf))
 
     def test_export_has_14_genes(self):
         """CSV export must contain columns for all 14 genes.
@@ -1843,16 +1903,20 @@ class TestCSVRoundTrip(unittest.TestCase):
         to fully reconstruct a Horse object with identical phenotype.
         """
         original_phenotype = self.horse.phenotype
-        horses_to_csv([self.horse], self.temp_file)
 
         gene_names = [
             'extension', 'agouti', 'dilution', 'dun', 'silver',
             'champagne', 'flaxen', 'sooty', 'gray', 'kit',
             'frame', 'splash', 'leopard', 'patn1'
         ]
-        with open(self.temp_file, 'r') as f:
-            reader = csv.DictReader(f)
-            row = next(reader)
+        # Goes through a real file so the path branch of horses_to_csv is covered;
+        # the directory is removed on exit
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            temp_file = os.path.join(tmp_dir, 'horses.csv')
+            horses_to_csv([self.horse], temp_file)
+            with open(temp_file, 'r') as f:
+                reader = csv.DictReader(f)
+                row = next(reader)
 
         genotype = {}
         for gene in gene_names:
@@ -2008,8 +2072,9 @@ class TestMultiGeneInteractions(unittest.TestCase):
     color combinations documented in equine genetics literature.
     """
 
-    def setUp(self):
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, dilution=('N', 'N'),
                          dun=('nd2', 'nd2'), silver=('n', 'n'),
@@ -2097,9 +2162,10 @@ class TestKITGene(unittest.TestCase):
     exactly 2 KIT alleles, so it cannot carry more than 2 KIT patterns.
     """
 
-    def setUp(self):
-        """Initialize calculator for each test."""
-        self.calc = PhenotypeCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Initialize calculator once for all tests in the class."""
+        cls.calc = PhenotypeCalculator()
 
     def _create_genotype(self, extension, agouti, kit,
                         dilution=('N', 'N'), dun=('nd2', 'nd2'),
@@ -2160,6 +2226,111 @@ class TestKITGene(unittest.TestCase):
         self.assertIn('Sabino', phenotype)
 
 
+class TestPedigreeTree(unittest.TestCase):
+    """Test pedigree aggregates kept up to date by PedigreeTree.add_horse."""
+
+    def test_aggregates_track_breedings(self):
+        """max_generation and foundation_count must match a full scan."""
+        tree = PedigreeTree()
+        self.assertEqual(tree.max_generation, 0)
+        self.assertEqual(tree.foundation_count, 0)
+
+        rest = ("Dil:N/N D:nd2/nd2 Z:n/n Ch:n/n F:F/F STY:sty/sty G:g/g "
+                "KIT:n/n O:n/n Spl:n/n Lp:lp/lp PATN1:n/n")
+        sire = Horse.from_string(f"E:E/E A:A/A {rest}")
+        dam = Horse.from_string(f"E:e/e A:a/a {rest}")
+        foal = Horse.from_string(f"E:E/e A:A/a {rest}")
+        grandfoal = Horse.from_string(f"E:E/e A:a/a {rest}")
+
+        tree.add_breeding(sire, dam, foal)
+        tree.add_breeding(foal, dam, grandfoal)
+
+        self.assertEqual(tree.max_generation, 2)
+        self.assertEqual(tree.foundation_count, 2)
+        self.assertEqual(tree.max_generation, max(h.generation for h in tree.horses.values()))
+        self.assertEqual(
+            tree.foundation_count,
+            sum(1 for h in tree.horses.values() if h.sire_id is None and h.dam_id is None)
+        )
+
+    def test_aggregates_handle_replaced_horse(self):
+        """Re-adding an existing ID must not double count or keep a stale maximum."""
+        tree = PedigreeTree()
+        tree.add_horse('a', 'Bay', 'E:E/E', generation=0)
+        tree.add_horse('b', 'Bay', 'E:E/E', generation=3, sire_id='a', dam_id='a')
+        self.assertEqual(tree.max_generation, 3)
+        self.assertEqual(tree.foundation_count, 1)
+
+        tree.add_horse('b', 'Bay', 'E:E/E', generation=0)
+        self.assertEqual(tree.max_generation, 0)
+        self.assertEqual(tree.foundation_count, 2)
+
+    def test_horses_by_generation(self):
+        """Grouping must be ordered by generation and keep insertion order within one."""
+        tree = PedigreeTree()
+        tree.add_horse('c', 'Bay', 'E:E/E', generation=2)
+        tree.add_horse('a', 'Bay', 'E:E/E', generation=0)
+        tree.add_horse('d', 'Bay', 'E:E/E', generation=2)
+        tree.add_horse('b', 'Bay', 'E:E/E', generation=0)
+
+        grouped = tree.horses_by_generation()
+
+        self.assertEqual(list(grouped), [0, 2])
+        self.assertEqual([h.horse_id for h in grouped[0]], ['a', 'b'])
+        self.assertEqual([h.horse_id for h in grouped[2]], ['c', 'd'])
+        self.assertEqual(PedigreeTree().horses_by_generation(), {})
+
+    def test_detect_inbreeding_reuses_ancestors(self):
+        """Passing precomputed ancestors must give the same result as a fresh traversal."""
+        tree = PedigreeTree()
+        tree.add_horse('a', 'Bay', 'E:E/E', generation=0)
+        tree.add_horse('b', 'Bay', 'E:E/E', generation=0)
+        tree.add_horse('c', 'Bay', 'E:E/E', generation=1, sire_id='a', dam_id='b')
+        tree.add_horse('d', 'Bay', 'E:E/E', generation=1, sire_id='a', dam_id='b')
+        tree.add_horse('e', 'Bay', 'E:E/E', generation=2, sire_id='c', dam_id='d')
+
+        ancestors = tree.get_ancestors('e', 2)
+        expected = tree.detect_inbreeding('e', 2)
+
+        self.assertEqual(expected, {'a': 2, 'b': 2})
+        self.assertEqual(tree.detect_inbreeding('e', 2, ancestors), expected)
+
+
+class TestStableImport(unittest.TestCase):
+    """Test the Streamlit stable import buttons"""
+
+    def setUp(self):
+        try:
+            from streamlit.testing.v1 import AppTest
+        except ImportError:
+            self.skipTest("streamlit is not installed")
+        self.app = AppTest.from_file(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'streamlit_app.py'),
+            default_timeout=60
+        )
+        self.app.run()
+
+    def test_json_and_csv_uploads_are_imported_once(self):
+        """Having a file in both uploaders must not re-import either of them"""
+        app = self.app
+        app.sidebar.radio[0].set_value(app.sidebar.radio[0].options[3]).run()
+
+        json_data = json.dumps([Horse.random().to_dict() for _ in range(2)]).encode('utf-8')
+        csv_data = b"Name,extension,agouti\nImported,E/e,A/a\n"
+        uploaders = {u.key: u for u in app.file_uploader}
+        uploaders['json_upload'].set_value(('stable.json', json_data, 'application/json'))
+        uploaders['csv_upload'].set_value(('stable.csv', csv_data, 'text/csv'))
+        app.run()
+
+        self.assertFalse(app.exception)
+        self.assertEqual(len(app.session_state.stable['horses']), 3)
+
+        # Later reruns keep both files in the uploaders but add nothing
+        app.run()
+        app.run()
+        self.assertEqual(len(app.session_state.stable['horses']), 3)
+
+
 def run_tests():
     """Run all tests and print results."""
     # Create test suite
@@ -2192,6 +2363,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestLethalBreedingOutcomes))
     suite.addTests(loader.loadTestsFromTestCase(TestLethalValidation))
     suite.addTests(loader.loadTestsFromTestCase(TestMultiGeneInteractions))
+    suite.addTests(loader.loadTestsFromTestCase(TestPedigreeTree))
+    suite.addTests(loader.loadTestsFromTestCase(TestStableImport))
 
     # Run tests with verbose output
     runner = unittest.TextTestRunner(verbosity=2)